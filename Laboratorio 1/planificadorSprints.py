@@ -0,0 +1,329 @@
+"""
+    Planificador de sprints en flujo continuo
+
+    Descripción:
+        Versión continua de punto1.py: las tareas llegan, se completan y
+        cambian de prioridad todo el tiempo, y se planifica un sprint
+        tras otro (horizonte rodante). Los eventos se leen de un
+        generador o de un archivo .jsonl y después de cada uno el plan
+        del sprint siguiente queda actualizado.
+
+        El modelo de punto1.py es una mochila binaria: maximizar el
+        valor de las prioridades con a lo sumo 4 x 13 = 52 puntos. Como
+        la capacidad es pequeña, en lugar de reconstruir y resolver el
+        modelo de Pyomo con glpk en cada evento:
+        - Las tareas se agrupan por puntos de historia, cada grupo
+          ordenado por valor (con bisect). De un grupo de w puntos solo
+          pueden entrar al plan sus 52 // w tareas de mayor valor, así
+          que el problema se reduce a unas pocas decenas de candidatas
+          sin perder optimalidad.
+        - El modelo se mantiene vivo: un evento solo cambia el valor o
+          la presencia de una tarea en su grupo, y si no toca a las
+          candidatas el plan anterior sigue siendo óptimo.
+        - Si las toca, la programación dinámica por grupos se recalcula
+          a partir del grupo que cambió, reutilizando las tablas de los
+          grupos anteriores (arranque en caliente).
+"""
+
+import bisect
+import json
+import random
+import time
+
+import numpy as np
+
+# Mismos datos de punto1.py
+numeroDesarrolladores = 4
+puntosMaximosPorDesarrollador = 13
+valorPorPrioridad = {
+    "Maxima": 7,
+    "Alta": 6,
+    "Media alta": 5,
+    "Media": 4,
+    "Media baja": 3,
+    "Baja": 2,
+    "Minima": 1
+}
+puntosPorTarea = [5, 3, 13, 1, 21, 2, 2, 5, 8, 13, 21]
+prioridadPorTarea = ["Maxima", "Media alta", "Alta", "Media baja", "Minima", "Media", "Alta", "Media", "Baja", "Maxima", "Alta"]
+
+
+class PlanificadorSprints:
+
+    """
+        Inicializa el planificador con el backlog vacío
+        Parámetros:
+        - capacidad: puntos de historia por sprint
+        - valores: valor de cada nombre de prioridad
+    """
+    def __init__(self, capacidad=numeroDesarrolladores * puntosMaximosPorDesarrollador, valores=valorPorPrioridad):
+        self.capacidad = capacidad
+        self.valores = valores
+        # id -> (puntos, clave en su grupo); la clave (-valor, llegada, id) ordena el grupo por valor
+        self.tareas = {}
+        self.grupos = {}
+        self.pesos = []
+        # Tablas de la programación dinámica por grupo y primer grupo cuyas candidatas cambiaron
+        self.tablas = []
+        self.elecciones = []
+        self.sucio = None
+        self.llegadas = 0
+        self.plan = []
+        self.valorPlan = 0
+        self.sprints = 0
+        self.resoluciones = 0
+        self.ignorados = 0
+        self.latencias = []
+
+    """
+        Retorna el valor numérico de una prioridad (nombre de punto1.py o número)
+    """
+    def valor(self, prioridad):
+        return self.valores[prioridad] if isinstance(prioridad, str) else prioridad
+
+    """
+        Marca como desactualizadas las tablas desde el grupo de w puntos
+    """
+    def marcar(self, puntos):
+        indice = bisect.bisect_left(self.pesos, puntos)
+        self.sucio = indice if self.sucio is None else min(self.sucio, indice)
+
+    """
+        Inserta una tarea en su grupo; solo cambia el plan si entra entre las candidatas del grupo
+    """
+    def insertar(self, tarea, puntos, valor):
+        clave = (-valor, self.llegadas, tarea)
+        self.llegadas += 1
+        self.tareas[tarea] = (puntos, clave)
+        if puntos > self.capacidad:
+            return
+        if puntos not in self.grupos:
+            self.grupos[puntos] = []
+            bisect.insort(self.pesos, puntos)
+            self.marcar(puntos)
+        grupo = self.grupos[puntos]
+        posicion = bisect.bisect_left(grupo, clave)
+        grupo.insert(posicion, clave)
+        if posicion < self.capacidad // puntos:
+            self.marcar(puntos)
+
+    """
+        Elimina una tarea de su grupo; solo cambia el plan si era una de las candidatas del grupo
+    """
+    def eliminar(self, tarea):
+        puntos, clave = self.tareas.pop(tarea)
+        if puntos > self.capacidad:
+            return
+        grupo = self.grupos[puntos]
+        posicion = bisect.bisect_left(grupo, clave)
+        del grupo[posicion]
+        if posicion < self.capacidad // puntos:
+            self.marcar(puntos)
+        if not grupo:
+            del self.grupos[puntos]
+            del self.pesos[bisect.bisect_left(self.pesos, puntos)]
+
+    """
+        Recalcula la programación dinámica desde el primer grupo desactualizado. Para cada grupo de w puntos
+        con candidatas de valores v1 >= v2 >= ..., tomar t tareas cuesta t * w puntos y aporta v1 + ... + vt:
+
+            tabla[c] = max_t tablaAnterior[c - t * w] + v1 + ... + vt
+    """
+    def resolver(self):
+        if self.sucio is None:
+            return
+        del self.tablas[self.sucio:]
+        del self.elecciones[self.sucio:]
+        for indice in range(self.sucio, len(self.pesos)):
+            puntos = self.pesos[indice]
+            candidatas = self.grupos[puntos][:self.capacidad // puntos]
+            acumulado = np.cumsum([-clave[0] for clave in candidatas])
+            anterior = self.tablas[-1] if self.tablas else np.zeros(self.capacidad + 1, dtype=np.int64)
+            tabla = anterior.copy()
+            eleccion = np.zeros(self.capacidad + 1, dtype=np.int64)
+            for t in range(1, len(candidatas) + 1):
+                desplazada = np.full(self.capacidad + 1, -1, dtype=np.int64)
+                desplazada[t * puntos:] = anterior[:self.capacidad + 1 - t * puntos] + acumulado[t - 1]
+                mejora = desplazada > tabla
+                tabla[mejora] = desplazada[mejora]
+                eleccion[mejora] = t
+            self.tablas.append(tabla)
+            self.elecciones.append(eleccion)
+
+        # Reconstrucción del plan desde el último grupo
+        self.plan = []
+        capacidadRestante = self.capacidad
+        for indice in reversed(range(len(self.pesos))):
+            t = int(self.elecciones[indice][capacidadRestante])
+            self.plan += [clave[2] for clave in self.grupos[self.pesos[indice]][:t]]
+            capacidadRestante -= t * self.pesos[indice]
+        self.valorPlan = int(self.tablas[-1][-1]) if self.tablas else 0
+        self.sucio = None
+        self.resoluciones += 1
+
+    """
+        Cierra el sprint: las tareas del plan se comprometen, salen del backlog y se planifica el siguiente
+        Retorna:
+        - Lista con las tareas comprometidas en el sprint
+    """
+    def cerrarSprint(self):
+        self.resolver()
+        comprometidas = self.plan
+        for tarea in comprometidas:
+            self.eliminar(tarea)
+        self.sprints += 1
+        self.resolver()
+        return comprometidas
+
+    """
+        Procesa un evento y deja el plan actualizado, midiendo su latencia. Eventos:
+        - {'tipo': 'agregar', 'id': ..., 'puntos': ..., 'prioridad': ...}
+        - {'tipo': 'completar', 'id': ...}
+        - {'tipo': 'repriorizar', 'id': ..., 'prioridad': ...}
+        - {'tipo': 'sprint'}: cierra el sprint actual
+        Los eventos sobre tareas que ya no están en el backlog (por ejemplo ya comprometidas) se ignoran
+        Retorna:
+        - Las tareas comprometidas si el evento cierra un sprint, si no None
+    """
+    def procesar(self, evento):
+        inicio = time.perf_counter()
+        tipo = evento['tipo']
+        comprometidas = None
+        if tipo == 'sprint':
+            comprometidas = self.cerrarSprint()
+        elif tipo == 'agregar':
+            if evento['id'] in self.tareas:
+                self.eliminar(evento['id'])
+            self.insertar(evento['id'], evento['puntos'], self.valor(evento['prioridad']))
+        elif tipo in ('completar', 'repriorizar'):
+            if evento['id'] not in self.tareas:
+                self.ignorados += 1
+            else:
+                puntos, _ = self.tareas[evento['id']]
+                self.eliminar(evento['id'])
+                if tipo == 'repriorizar':
+                    self.insertar(evento['id'], puntos, self.valor(evento['prioridad']))
+        else:
+            raise ValueError(f"Tipo de evento no soportado: {tipo}")
+        self.resolver()
+        self.latencias.append(time.perf_counter() - inicio)
+        return comprometidas
+
+    """
+        Consume un flujo de eventos
+        Parámetros:
+        - eventos: generador o lista de eventos (por ejemplo leerEventos(ruta))
+        Retorna:
+        - Lista de sprints, cada uno con sus tareas comprometidas
+    """
+    def consumir(self, eventos):
+        sprints = []
+        for evento in eventos:
+            comprometidas = self.procesar(evento)
+            if comprometidas is not None:
+                sprints.append(comprometidas)
+        return sprints
+
+    """
+        Retorna el valor y los puntos del plan actual
+    """
+    def resumenPlan(self):
+        return {'tareas': len(self.plan), 'valor': self.valorPlan,
+                'puntos': sum(self.tareas[tarea][0] for tarea in self.plan), 'backlog': len(self.tareas)}
+
+    """
+        Retorna los percentiles de latencia por evento (en microsegundos) y los contadores del flujo
+    """
+    def resumenLatencias(self):
+        latencias = np.array(self.latencias) * 1e6
+        return {'eventos': len(latencias), 'resoluciones': self.resoluciones, 'ignorados': self.ignorados,
+                'sprints': self.sprints, 'p50': float(np.percentile(latencias, 50)),
+                'p99': float(np.percentile(latencias, 99)), 'maximo': float(latencias.max()),
+                'eventosPorSegundo': float(len(latencias) / latencias.sum() * 1e6)}
+
+
+"""
+    Lee los eventos de un archivo .jsonl (un evento por línea) sin cargar el archivo completo
+"""
+def leerEventos(ruta):
+    with open(ruta, encoding='utf-8') as archivo:
+        for linea in archivo:
+            if linea.strip():
+                yield json.loads(linea)
+
+
+"""
+    Escribe un flujo de eventos en un archivo .jsonl
+"""
+def guardarEventos(ruta, eventos):
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        for evento in eventos:
+            archivo.write(json.dumps(evento, ensure_ascii=False) + '\n')
+
+
+"""
+    Genera un flujo sintético de eventos: llegan n tareas con los puntos y prioridades de punto1.py,
+    mezcladas con tareas completadas, cambios de prioridad y cierres de sprint
+    Parámetros:
+    - n: número de tareas
+    - eventosPorSprint: cada cuántos eventos se cierra un sprint
+    - probabilidadCompletar, probabilidadRepriorizar: probabilidad de cada evento después de una llegada
+    - semilla: semilla del generador
+"""
+def generarEventos(n, eventosPorSprint=5000, probabilidadCompletar=0.2, probabilidadRepriorizar=0.3, semilla=0):
+    generador = random.Random(semilla)
+    prioridades = list(valorPorPrioridad)
+    eventos = 0
+    for tarea in range(n):
+        eventos += 1
+        yield {'tipo': 'agregar', 'id': f"T{tarea}", 'puntos': generador.choice(puntosPorTarea),
+               'prioridad': generador.choice(prioridades)}
+        if generador.random() < probabilidadCompletar:
+            eventos += 1
+            yield {'tipo': 'completar', 'id': f"T{generador.randrange(tarea + 1)}"}
+        if generador.random() < probabilidadRepriorizar:
+            eventos += 1
+            yield {'tipo': 'repriorizar', 'id': f"T{generador.randrange(tarea + 1)}", 'prioridad': generador.choice(prioridades)}
+        if eventos >= eventosPorSprint:
+            eventos = 0
+            yield {'tipo': 'sprint'}
+
+
+"""
+    Resuelve la mochila completa desde cero con programación dinámica sobre todas las tareas, como referencia
+    Parámetros:
+    - tareas: lista de tuplas (puntos, valor)
+    - capacidad: puntos del sprint
+    Retorna:
+    - Valor óptimo
+"""
+def seleccionDirecta(tareas, capacidad=numeroDesarrolladores * puntosMaximosPorDesarrollador):
+    tabla = np.zeros(capacidad + 1, dtype=np.int64)
+    for puntos, valor in tareas:
+        if puntos <= capacidad:
+            tabla[puntos:] = np.maximum(tabla[puntos:], tabla[:capacidad + 1 - puntos] + valor)
+    return int(tabla[-1])
+
+
+def main():
+    # Las 11 tareas de punto1.py como eventos: el plan debe tener el mismo valor que la solución de glpk
+    planificador = PlanificadorSprints()
+    planificador.consumir({'tipo': 'agregar', 'id': f"T{tarea + 1}", 'puntos': puntos, 'prioridad': prioridad}
+                          for tarea, (puntos, prioridad) in enumerate(zip(puntosPorTarea, prioridadPorTarea)))
+    print("Plan de punto1.py:", sorted(planificador.plan, key=lambda tarea: int(tarea[1:])), planificador.resumenPlan())
+
+    # Flujo de 10^5 tareas
+    planificador = PlanificadorSprints()
+    sprints = planificador.consumir(generarEventos(10**5))
+    print(f"{len(sprints)} sprints comprometidos, plan actual: {planificador.resumenPlan()}")
+    print("Latencia por evento (µs):", {k: round(v, 1) for k, v in planificador.resumenLatencias().items()})
+
+    # Referencia: resolver desde cero todo el backlog en un solo evento
+    tareas = [(puntos, -clave[0]) for puntos, clave in planificador.tareas.values()]
+    inicio = time.perf_counter()
+    valorDirecto = seleccionDirecta(tareas)
+    print(f"Desde cero: valor {valorDirecto} (incremental {planificador.valorPlan}) en {(time.perf_counter() - inicio) * 1e3:.1f} ms por evento")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,9 @@
 
 from pyomo.environ import *
 from pyomo.opt import SolverFactory
+
+# Ramificación y acotamiento en el mismo proceso
+from ramificacionAcotamiento import resolverModelo
 from matplotlib import pyplot as plt
 
 # Datos
@@ -67,7 +70,12 @@ M.obj = Objective(expr = sum(M.tareas[tarea] * valorPorPrioridad[prioridadPorTar
 # Restricciones
 M.res = Constraint(expr = sum(M.tareas[tarea] * puntosPorTarea[tarea] for tarea in M.tareas) <= puntosMaximosPorDesarrollador * numeroDesarrolladores )
 
-SolverFactory('glpk').solve(M)
+# Se resuelve en el mismo proceso, sin llamar a glpk; con usarGlpk = True se usa glpk como antes
+usarGlpk = False
+if usarGlpk:
+    SolverFactory('glpk').solve(M)
+else:
+    print(resolverModelo(M).resumen())
 
 M.display()
 
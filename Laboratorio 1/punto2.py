@@ -18,6 +18,9 @@
 from pyomo.environ import *
 from pyomo.opt import SolverFactory
 
+# Ramificación y acotamiento en el mismo proceso
+from ramificacionAcotamiento import resolverModelo
+
 # Datos del problema
 horasDisponiblesPorTrabajador = [8, 10, 6]
 gananciaPorTrabajo = [50, 60, 40, 70, 30]
@@ -49,7 +52,12 @@ M.limiteHoras = ConstraintList()
 for trabajador in M.trabajadores:
     M.limiteHoras.add(expr = sum(M.asignacion[tarea, trabajador] * tiempoPorTrabajo[tarea] for tarea in M.tareas) <= horasDisponiblesPorTrabajador[trabajador])
 
-SolverFactory('glpk').solve(M)
+# Se resuelve en el mismo proceso, sin llamar a glpk; con usarGlpk = True se usa glpk como antes
+usarGlpk = False
+if usarGlpk:
+    SolverFactory('glpk').solve(M)
+else:
+    print(resolverModelo(M).resumen())
 
 M.display()
 
@@ -19,6 +19,9 @@
 from pyomo.environ import *
 from pyomo.opt import SolverFactory
 
+# Ramificación y acotamiento en el mismo proceso
+from ramificacionAcotamiento import resolverModelo
+
 M = ConcreteModel()
 
 # Datos
@@ -78,7 +81,12 @@ M.compatibilidadEquiposAgua = ConstraintList()
 for avion in M.aviones:
     M.compatibilidadEquiposAgua.add(expr = M.asignacion[idPorNombre["Equipos Médicos"],avion] + M.asignacion[idPorNombre["Agua Potable"],avion] <= 1)
 
-SolverFactory('glpk').solve(M)
+# Se resuelve en el mismo proceso, sin llamar a glpk; con usarGlpk = True se usa glpk como antes
+usarGlpk = False
+if usarGlpk:
+    SolverFactory('glpk').solve(M)
+else:
+    print(resolverModelo(M).resumen())
 
 M.display()
 
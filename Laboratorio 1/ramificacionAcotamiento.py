@@ -0,0 +1,498 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Ramificación y acotamiento (branch and bound) sobre un simplex tabular (el de la
+clase Simplex de Laboratorio 4/punto 1.2.py, con la base explícita y el simplex
+dual), para resolver en el mismo proceso los modelos binarios pequeños de este
+laboratorio sin llamar al ejecutable de glpk.
+
+- Cada nodo guarda su tabla óptima. Los hijos parten de la tabla del padre: se
+  agrega la restricción de ramificación (x_j <= piso o x_j >= techo) como una fila
+  nueva con su holgura, la tabla sigue siendo óptima para los costos (factible
+  dual) y el simplex dual recupera la factibilidad en pocos pivoteos.
+- Los nodos pendientes se guardan en un heap ordenado por su cota (mejor cota
+  primero) y se podan cuando su cota no supera a la mejor solución entera.
+- La variable de ramificación se elige por mayor fraccionalidad o por
+  pseudocostos (ganancia promedio de la cota por unidad de cambio).
+- Se registra la evolución del número de nodos, la mejor solución, la mejor
+  cota y la brecha (gap) en el tiempo.
+
+Internamente siempre se maximiza. Los modelos que minimizan o tienen una constante
+en el objetivo se reportan (resumen, historial y valor retornado) en su propio
+sentido, con signo * valor + constante.
+
+La raíz se resuelve en dos fases: el simplex dual con costos nulos encuentra una
+base factible (las restricciones >= e = dejan lados derechos negativos) y luego
+el simplex primal optimiza los costos reales.
+
+"""
+
+import heapq
+import math
+import time
+
+TOLERANCIA = 1e-9
+
+
+class SimplexDual:
+
+    """
+        Inicializa el simplex para maximizar c x sujeto a A x <= b y x >= 0, donde b puede tener valores
+        negativos (restricciones >= o = convertidas)
+        Parámetros:
+        - coeficientes: lista de coeficientes de la función objetivo (negativos para maximización)
+        - restricciones: matriz con los coeficientes de las restricciones
+        - soluciones: lista con los lados derechos
+    """
+    def __init__(self, coeficientes, restricciones, soluciones):
+        self.coeficientes = coeficientes
+        self.restricciones = restricciones
+        self.soluciones = soluciones
+        # Dimensiones de la tabla
+        self.m, self.n = len(restricciones), len(restricciones[0])
+        self.tabla = []
+        # Columna básica de cada fila (al inicio, las holguras)
+        self.base = [self.n + i for i in range(self.m)]
+        self.pivoteos = 0
+
+    """
+        Inicializa la tabla con una variable de holgura por restricción y la fila de la función objetivo al final
+    """
+    def inicializarTabla(self):
+        self.tabla = [list(fila) + [1 if k == i else 0 for k in range(self.m)] + [self.soluciones[i]]
+                      for i, fila in enumerate(self.restricciones)]
+        self.tabla.append(list(self.coeficientes) + [0] * (self.m + 1))
+
+    """
+        Columna pivote del simplex primal: la de costo reducido más negativo
+    """
+    def obtenerColumnaPivote(self):
+        return self.tabla[-1].index(min(self.tabla[-1][:-1]))
+
+    """
+        Valor máximo de la función objetivo (extremo derecho de la fila objetivo)
+    """
+    def obtenerValorMaximo(self):
+        return self.tabla[-1][-1]
+
+    """
+        Verifica si la solución es óptima, con tolerancia para los errores de redondeo
+    """
+    def esOptimo(self):
+        return min(self.tabla[-1][:-1]) >= -TOLERANCIA
+
+    """
+        Razón mínima del simplex primal, ignorando los valores de la columna cercanos a cero.
+        Retorna None si el problema no es acotado en la dirección de la columna
+    """
+    def obtenerFilaPivote(self, columnaPivote):
+        divisiones = [(self.tabla[i][-1] / self.tabla[i][columnaPivote]
+                      if self.tabla[i][columnaPivote] > TOLERANCIA else math.inf) for i in range(self.m)]
+        menor = min(divisiones)
+        return None if menor == math.inf else divisiones.index(menor)
+
+    """
+        Pivotea (con filas de cualquier ancho, ya que los nodos agregan filas y columnas) y actualiza la base
+    """
+    def realizarPivoteo(self, filaPivote, columnaPivote):
+        pivote = self.tabla[filaPivote][columnaPivote]
+        fila = [x / pivote for x in self.tabla[filaPivote]]
+        self.tabla[filaPivote] = fila
+        for i in range(self.m + 1):
+            cociente = self.tabla[i][columnaPivote]
+            if i != filaPivote and cociente != 0:
+                self.tabla[i] = [x - cociente * y for x, y in zip(self.tabla[i], fila)]
+        self.base[filaPivote] = columnaPivote
+        self.pivoteos += 1
+
+    """
+        Simplex primal desde una base factible
+        Retorna:
+        - True si se llegó al óptimo (lanza ValueError si el problema no es acotado)
+    """
+    def resolverPrimal(self):
+        while not self.esOptimo():
+            columnaPivote = self.obtenerColumnaPivote()
+            filaPivote = self.obtenerFilaPivote(columnaPivote)
+            if filaPivote is None:
+                raise ValueError("El problema no es acotado")
+            self.realizarPivoteo(filaPivote, columnaPivote)
+        return True
+
+    """
+        Simplex dual desde una base factible dual (fila objetivo sin valores negativos): sale la fila con el
+        lado derecho más negativo y entra la columna con la menor razón entre su costo reducido y el valor
+        negativo de la fila. Con bland=True se usan los menores índices (evita ciclos con costos nulos)
+        Retorna:
+        - True si se llegó a una base factible, False si el problema es infactible
+    """
+    def resolverDual(self, bland=False):
+        while True:
+            negativas = [i for i in range(self.m) if self.tabla[i][-1] < -TOLERANCIA]
+            if not negativas:
+                return True
+            filaPivote = negativas[0] if bland else min(negativas, key=lambda i: self.tabla[i][-1])
+            fila, objetivo = self.tabla[filaPivote], self.tabla[-1]
+            candidatas = [j for j in range(len(fila) - 1) if fila[j] < -TOLERANCIA]
+            if not candidatas:
+                return False
+            columnaPivote = min(candidatas, key=lambda j: (max(objetivo[j], 0) / -fila[j], j))
+            self.realizarPivoteo(filaPivote, columnaPivote)
+
+    """
+        Resuelve el problema desde la tabla inicial en dos fases
+        Retorna:
+        - True si hay solución óptima, False si el problema es infactible
+    """
+    def resolverDosFases(self):
+        self.inicializarTabla()
+        objetivo = self.tabla[-1]
+        # Fase 1: con costos nulos toda base es factible dual y el simplex dual busca una base factible
+        self.tabla[-1] = [0.0] * len(objetivo)
+        if not self.resolverDual(bland=True):
+            return False
+        # Fase 2: se restauran los costos expresados en la base actual
+        for i, columna in enumerate(self.base):
+            if objetivo[columna] != 0:
+                cociente = objetivo[columna]
+                objetivo = [x - cociente * y for x, y in zip(objetivo, self.tabla[i])]
+        self.tabla[-1] = objetivo
+        return self.resolverPrimal()
+
+    """
+        Agrega a la tabla óptima la restricción x_j <= limite (o x_j >= limite con mayorIgual=True) con una
+        holgura nueva, expresada en la base actual
+    """
+    def agregarCota(self, variable, limite, mayorIgual=False):
+        signo = -1.0 if mayorIgual else 1.0
+        columnaHolgura = len(self.tabla[0]) - 1
+        for fila in self.tabla:
+            fila.insert(columnaHolgura, 0.0)
+        nueva = [0.0] * (columnaHolgura + 2)
+        nueva[variable] = signo
+        nueva[columnaHolgura] = 1.0
+        nueva[-1] = signo * limite
+        if variable in self.base:
+            basica = self.tabla[self.base.index(variable)]
+            nueva = [x - signo * y for x, y in zip(nueva, basica)]
+        self.tabla.insert(self.m, nueva)
+        self.base.append(columnaHolgura)
+        self.m += 1
+
+    """
+        Extrae la solución de la tabla a partir de la base (sin buscar los unos en las filas)
+    """
+    def obtenerSolucion(self):
+        solucionOptima = [0.0] * self.n
+        for i, columna in enumerate(self.base):
+            if columna < self.n:
+                solucionOptima[columna] = self.tabla[i][-1]
+        return solucionOptima
+
+    """
+        Copia la tabla y la base para que un nodo hijo parta de ellas
+    """
+    def copiar(self):
+        copia = SimplexDual.__new__(SimplexDual)
+        copia.coeficientes, copia.restricciones, copia.soluciones = self.coeficientes, self.restricciones, self.soluciones
+        copia.m, copia.n = self.m, self.n
+        copia.tabla = [fila[:] for fila in self.tabla]
+        copia.base = self.base[:]
+        copia.pivoteos = 0
+        return copia
+
+
+class RamificacionAcotamiento:
+
+    """
+        Define el problema entero mixto: maximizar objetivo x sujeto a las restricciones, x >= 0
+        Parámetros:
+        - objetivo: coeficientes de la función objetivo (se maximiza)
+        - restricciones: matriz con los coeficientes de las restricciones
+        - sentidos: '<=', '>=' o '=' por cada restricción
+        - lados: lados derechos de las restricciones
+        - enteras: índices de las variables enteras (por defecto todas)
+        - cotas: cota superior de cada variable (None si no tiene); para binarias 1
+        - regla: 'fraccional' (variable más fraccional) o 'pseudocosto'
+        - tolerancia: distancia a un entero por debajo de la cual un valor se considera entero
+        - signo, constante: el objetivo del modelo original es signo * valor + constante (signo -1 si minimiza)
+    """
+    def __init__(self, objetivo, restricciones, sentidos, lados, enteras=None, cotas=None, regla='pseudocosto', tolerancia=1e-6,
+                 signo=1.0, constante=0.0):
+        if regla not in ('fraccional', 'pseudocosto'):
+            raise ValueError(f"Regla de ramificación no soportada: {regla}")
+        self.n = len(objetivo)
+        self.objetivo = [float(c) for c in objetivo]
+        self.enteras = list(range(self.n)) if enteras is None else list(enteras)
+        self.regla = regla
+        self.tolerancia = tolerancia
+        self.signo = signo
+        self.constante = constante
+        # Todas las restricciones se llevan a la forma A x <= b de la clase Simplex
+        filas, derechos = [], []
+        for coeficientes, sentido, lado in zip(restricciones, sentidos, lados):
+            if sentido in ('<=', '='):
+                filas.append([float(a) for a in coeficientes])
+                derechos.append(float(lado))
+            if sentido in ('>=', '='):
+                filas.append([-float(a) for a in coeficientes])
+                derechos.append(-float(lado))
+            if sentido not in ('<=', '>=', '='):
+                raise ValueError(f"Sentido de restricción no soportado: {sentido}")
+        for j, cota in enumerate(cotas or []):
+            if cota is not None:
+                filas.append([1.0 if k == j else 0.0 for k in range(self.n)])
+                derechos.append(float(cota))
+        self.filas, self.derechos = filas, derechos
+        # Pseudocostos: suma de ganancias por unidad y número de observaciones, hacia abajo y hacia arriba
+        self.pseudocostos = {j: [0.0, 0, 0.0, 0] for j in self.enteras}
+        self.solucion = None
+        self.valor = -math.inf
+        self.estado = None
+        self.nodos = 0
+        self.pivoteos = 0
+        self.historial = []
+
+    """
+        Retorna la variable entera más lejana de un entero y su valor, o None si la solución es entera
+    """
+    def variableFraccional(self, solucion):
+        fracciones = {j: solucion[j] - math.floor(solucion[j]) for j in self.enteras}
+        fraccionales = [j for j, f in fracciones.items() if self.tolerancia < f < 1 - self.tolerancia]
+        if not fraccionales:
+            return None
+        if self.regla == 'fraccional':
+            return max(fraccionales, key=lambda j: min(fracciones[j], 1 - fracciones[j]))
+        # Las variables sin observaciones usan el promedio de las observadas (1 si no hay ninguna)
+        promedios = []
+        for direccion in (0, 2):
+            observadas = [p[direccion] / p[direccion + 1] for p in self.pseudocostos.values() if p[direccion + 1]]
+            promedios.append(sum(observadas) / len(observadas) if observadas else 1.0)
+
+        def puntaje(j):
+            p = self.pseudocostos[j]
+            abajo = p[0] / p[1] if p[1] else promedios[0]
+            arriba = p[2] / p[3] if p[3] else promedios[1]
+            return max(abajo * fracciones[j], 1e-6) * max(arriba * (1 - fracciones[j]), 1e-6)
+
+        return max(fraccionales, key=puntaje)
+
+    """
+        Convierte un valor del problema maximizado internamente al objetivo del modelo original
+    """
+    def reportado(self, valor):
+        return self.signo * valor + self.constante
+
+    """
+        Registra el estado de la búsqueda en el historial, en el sentido del modelo original
+    """
+    def registrar(self, inicio, cota):
+        cota = max(cota, self.valor)
+        incumbente = self.reportado(self.valor)
+        brecha = (cota - self.valor) / max(abs(incumbente), 1e-9) if self.solucion is not None else math.inf
+        self.historial.append({'tiempo': time.perf_counter() - inicio, 'nodos': self.nodos,
+                               'incumbente': incumbente, 'cota': self.reportado(cota), 'brecha': brecha})
+
+    """
+        Resuelve el problema
+        Parámetros:
+        - limiteNodos: máximo de nodos a explorar (opcional)
+        - limiteTiempo: máximo de segundos (opcional)
+        - cadaN: además de cada mejora, se registra el historial cada N nodos
+        Retorna:
+        - Tupla (solución, valor del objetivo original); la solución es None si el problema es infactible
+    """
+    def resolver(self, limiteNodos=None, limiteTiempo=None, cadaN=100):
+        inicio = time.perf_counter()
+        raiz = SimplexDual([-c for c in self.objetivo], self.filas, self.derechos)
+        if not raiz.resolverDosFases():
+            self.estado = 'infactible'
+            return None, None
+        self.nodos = 1
+        self.pivoteos = raiz.pivoteos
+        contador = 0
+        pendientes = [(-raiz.obtenerValorMaximo(), contador, raiz)]
+        cota = raiz.obtenerValorMaximo()
+        self.registrar(inicio, cota)
+        self.estado = 'optimo'
+
+        while pendientes:
+            cota = -pendientes[0][0]
+            # Mejor cota primero: si la mejor cota pendiente no supera la incumbente, ningún nodo puede hacerlo
+            if cota <= self.valor + self.tolerancia:
+                break
+            if (limiteNodos is not None and self.nodos >= limiteNodos) or (
+                    limiteTiempo is not None and time.perf_counter() - inicio >= limiteTiempo):
+                self.estado = 'limite'
+                break
+            _, _, nodo = heapq.heappop(pendientes)
+            valorNodo = nodo.obtenerValorMaximo()
+            solucion = nodo.obtenerSolucion()
+            variable = self.variableFraccional(solucion)
+            if variable is None:
+                # La raíz (o un nodo sin hijos evaluados) ya es entera
+                if valorNodo > self.valor:
+                    self.solucion, self.valor = solucion, valorNodo
+                    self.registrar(inicio, cota)
+                continue
+            valorVariable = solucion[variable]
+            for mayorIgual in (False, True):
+                hijo = nodo.copiar()
+                limite = math.ceil(valorVariable) if mayorIgual else math.floor(valorVariable)
+                hijo.agregarCota(variable, limite, mayorIgual)
+                factible = hijo.resolverDual()
+                self.nodos += 1
+                self.pivoteos += hijo.pivoteos
+                if not factible:
+                    continue
+                valorHijo = hijo.obtenerValorMaximo()
+                # Pseudocosto: pérdida de la cota por unidad de cambio de la variable
+                cambio = limite - valorVariable if mayorIgual else valorVariable - limite
+                observacion = self.pseudocostos[variable]
+                observacion[2 if mayorIgual else 0] += (valorNodo - valorHijo) / cambio
+                observacion[3 if mayorIgual else 1] += 1
+                if valorHijo <= self.valor + self.tolerancia:
+                    continue
+                solucionHijo = hijo.obtenerSolucion()
+                if self.variableFraccional(solucionHijo) is None:
+                    self.solucion, self.valor = solucionHijo, valorHijo
+                    self.registrar(inicio, max(cota, valorHijo))
+                else:
+                    contador += 1
+                    heapq.heappush(pendientes, (-valorHijo, contador, hijo))
+            if self.nodos - self.historial[-1]['nodos'] >= cadaN:
+                self.registrar(inicio, cota)
+
+        if self.estado == 'optimo':
+            cota = self.valor
+            if self.solucion is None:
+                self.estado = 'infactible'
+        self.registrar(inicio, cota)
+        if self.solucion is None:
+            return None, None
+        # Las variables enteras se redondean para eliminar los errores de la aritmética de punto flotante
+        self.solucion = [round(x) if j in self.enteras else x for j, x in enumerate(self.solucion)]
+        self.valor = sum(c * x for c, x in zip(self.objetivo, self.solucion))
+        return self.solucion, self.reportado(self.valor)
+
+    """
+        Retorna un diccionario con el estado, el valor del objetivo original, los nodos, los pivoteos y la brecha final
+    """
+    def resumen(self):
+        ultimo = self.historial[-1] if self.historial else {}
+        return {'estado': self.estado, 'valor': self.reportado(self.valor) if self.solucion is not None else None,
+                'nodos': self.nodos, 'pivoteos': self.pivoteos, 'brecha': ultimo.get('brecha'),
+                'tiempo': ultimo.get('tiempo')}
+
+
+"""
+    Construye el problema de un modelo lineal de Pyomo (objetivo y restricciones lineales, variables con
+    cota inferior 0)
+    Parámetros:
+    - Model: ConcreteModel
+    - opciones: parámetros de RamificacionAcotamiento (regla, tolerancia)
+    Retorna:
+    - Tupla (RamificacionAcotamiento, lista de variables de Pyomo en el orden de las columnas, signo, constante)
+"""
+def desdePyomo(Model, **opciones):
+    from pyomo.environ import Var, Constraint, Objective, maximize, value
+    from pyomo.repn import generate_standard_repn
+
+    variables = [v for v in Model.component_data_objects(Var, active=True) if not v.fixed]
+    columnas = {id(v): k for k, v in enumerate(variables)}
+
+    """
+        Convierte una expresión lineal en (lista de coeficientes, constante)
+    """
+    def coeficientesLineales(expresion):
+        repn = generate_standard_repn(expresion)
+        if not repn.is_linear():
+            raise ValueError(f"La expresión no es lineal: {expresion}")
+        coeficientes = [0.0] * len(variables)
+        for variable, coeficiente in zip(repn.linear_vars, repn.linear_coefs):
+            coeficientes[columnas[id(variable)]] += value(coeficiente)
+        return coeficientes, value(repn.constant)
+
+    objetivos = list(Model.component_data_objects(Objective, active=True))
+    if len(objetivos) != 1:
+        raise ValueError("El modelo debe tener exactamente una función objetivo activa")
+    objetivo, constante = coeficientesLineales(objetivos[0].expr)
+    signo = 1.0 if objetivos[0].sense == maximize else -1.0
+
+    restricciones, sentidos, lados = [], [], []
+    for restriccion in Model.component_data_objects(Constraint, active=True):
+        coeficientes, constanteRestriccion = coeficientesLineales(restriccion.body)
+        if restriccion.equality:
+            restricciones.append(coeficientes)
+            sentidos.append('=')
+            lados.append(value(restriccion.upper) - constanteRestriccion)
+            continue
+        if restriccion.has_ub():
+            restricciones.append(coeficientes)
+            sentidos.append('<=')
+            lados.append(value(restriccion.upper) - constanteRestriccion)
+        if restriccion.has_lb():
+            restricciones.append(coeficientes)
+            sentidos.append('>=')
+            lados.append(value(restriccion.lower) - constanteRestriccion)
+
+    cotas = []
+    for k, variable in enumerate(variables):
+        if variable.lb is None or variable.lb < 0:
+            raise ValueError(f"La variable {variable.name} debe tener cota inferior no negativa")
+        if variable.lb > 0:
+            restricciones.append([1.0 if j == k else 0.0 for j in range(len(variables))])
+            sentidos.append('>=')
+            lados.append(variable.lb)
+        cotas.append(variable.ub)
+    enteras = [k for k, variable in enumerate(variables) if variable.is_integer()]
+    problema = RamificacionAcotamiento([signo * c for c in objetivo], restricciones, sentidos, lados,
+                                       enteras=enteras, cotas=cotas, signo=signo, constante=constante, **opciones)
+    return problema, variables, signo, constante
+
+
+"""
+    Resuelve un modelo lineal entero de Pyomo en el mismo proceso y carga la solución en sus variables,
+    en lugar de SolverFactory('glpk').solve(Model)
+    Parámetros:
+    - Model: ConcreteModel
+    - opciones: parámetros de RamificacionAcotamiento (regla, tolerancia)
+    Retorna:
+    - RamificacionAcotamiento con el resumen y el historial de la búsqueda, en el sentido del objetivo del modelo
+"""
+def resolverModelo(Model, limiteNodos=None, limiteTiempo=None, **opciones):
+    problema, variables, _, _ = desdePyomo(Model, **opciones)
+    solucion, _ = problema.resolver(limiteNodos, limiteTiempo)
+    if solucion is not None:
+        for variable, valor in zip(variables, solucion):
+            variable.set_value(valor, skip_validation=True)
+    return problema
+
+
+def main():
+    from pyomo.environ import ConcreteModel, Var, Objective, Constraint, NonNegativeIntegers, minimize, maximize
+
+    # Minimización con constante: el valor reportado debe ser el del modelo (13) y no el maximizado (-3)
+    M = ConcreteModel()
+    M.x = Var(range(2), domain=NonNegativeIntegers)
+    M.obj = Objective(expr=3 * M.x[0] + 5 * M.x[1] + 10, sense=minimize)
+    M.res = Constraint(expr=M.x[0] + M.x[1] >= 1)
+    problema = resolverModelo(M)
+    print("Minimización:", problema.resumen(), "x =", [M.x[j].value for j in range(2)])
+    assert problema.resumen()['valor'] == 13 and problema.historial[-1]['cota'] == 13
+
+    # Maximización con constante: óptimo entero x = (4, 0) con valor 20 + 7
+    M = ConcreteModel()
+    M.x = Var(range(2), domain=NonNegativeIntegers)
+    M.obj = Objective(expr=5 * M.x[0] + 4 * M.x[1] + 7, sense=maximize)
+    M.res1 = Constraint(expr=6 * M.x[0] + 4 * M.x[1] <= 24)
+    M.res2 = Constraint(expr=M.x[0] + 2 * M.x[1] <= 6)
+    problema = resolverModelo(M)
+    print("Maximización:", problema.resumen(), "x =", [M.x[j].value for j in range(2)])
+    assert problema.resumen()['valor'] == 27
+
+
+if __name__ == "__main__":
+    main()
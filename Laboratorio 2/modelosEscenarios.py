@@ -0,0 +1,310 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Modelos de punto1.py (transporte), punto2.py (MTSP) y punto3.py (ubicación de
+sensores) construidos una sola vez para responder preguntas de tipo "¿qué pasa si?".
+Los scripts originales leen los CSV, construyen el modelo, resuelven y grafican al
+importarse; aquí cada modelo se construye con parámetros mutables, de modo que un
+escenario solo cambia los valores de algunos parámetros, resuelve y vuelve a dejar
+los valores del caso base. No se vuelven a leer archivos ni a construir el modelo.
+
+Un escenario es un diccionario con el nombre del modelo y los cambios:
+
+    {"modelo": "transporte", "cambios": {"ofertaBogota": 600, "demanda": {"2": 250}}}
+
+Los parámetros escalares reciben un número. Los indexados reciben una lista con
+todos los valores o un diccionario {"i": valor} ({"i,j": valor} si tienen dos índices).
+
+Parámetros de cada modelo:
+- transporte: ofertaBogota, ofertaMedellin, demanda[ciudad], costoBogota[ciudad], costoMedellin[ciudad]
+- mtsp: equipos, costo[i,j]
+- sensores: energia[sensor], instalacion[ubicacion], comunicacion[sensor,ubicacion], requerido[ubicacion,sensor]
+
+"""
+
+import os
+
+import pandas as pd
+from pyomo.environ import *
+from pyomo.opt import SolverFactory, TerminationCondition
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+ciudadPorIndice = ["Cali", "Barranquilla", "Pasto", "Tunja", "Chía", "Manizales"]
+
+
+"""
+    Construye el modelo de transporte de punto1.py con la oferta, la demanda y los costos como parámetros mutables
+
+    Retorna:
+    - Modelo de pyomo
+"""
+def crearTransporte():
+    costosTrasporteBogota = [1e8, 2.5, 1.6, 1.4, 0.8, 1.4]
+    costosTrasporteMedellin = [2.5, 1e8, 2.0, 1.0, 1.0, 0.8]
+    demandaPorCiudad = [125, 175, 225, 250, 225, 200]
+
+    M = ConcreteModel()
+    M.dual = Suffix(direction=Suffix.IMPORT)
+    M.ciudades = RangeSet(0, len(demandaPorCiudad) - 1)
+
+    M.ofertaBogota = Param(within = NonNegativeReals, initialize = 550, mutable = True)
+    M.ofertaMedellin = Param(within = NonNegativeReals, initialize = 700, mutable = True)
+    M.demanda = Param(M.ciudades, within = NonNegativeReals, initialize = lambda M, c: demandaPorCiudad[c], mutable = True)
+    M.costoBogota = Param(M.ciudades, within = NonNegativeReals, initialize = lambda M, c: costosTrasporteBogota[c], mutable = True)
+    M.costoMedellin = Param(M.ciudades, within = NonNegativeReals, initialize = lambda M, c: costosTrasporteMedellin[c], mutable = True)
+
+    M.toneladasDesdeBogota = Var(M.ciudades, domain = NonNegativeReals)
+    M.toneladasDesdeMedellin = Var(M.ciudades, domain = NonNegativeReals)
+
+    M.obj = Objective(expr = sum(M.toneladasDesdeBogota[c] * M.costoBogota[c] + M.toneladasDesdeMedellin[c] * M.costoMedellin[c] for c in M.ciudades), sense = minimize)
+    M.demandaPorCiudad = Constraint(M.ciudades, rule = lambda M, c: M.toneladasDesdeBogota[c] + M.toneladasDesdeMedellin[c] == M.demanda[c])
+    M.ofertaDesdeBogota = Constraint(expr = sum(M.toneladasDesdeBogota[c] for c in M.ciudades) <= M.ofertaBogota)
+    M.ofertaDesdeMedellin = Constraint(expr = sum(M.toneladasDesdeMedellin[c] for c in M.ciudades) <= M.ofertaMedellin)
+    return M
+
+
+"""
+    Construye el modelo MTSP de punto2.py con el número de equipos y los costos de los arcos como parámetros mutables
+
+    Parámetros:
+    - ruta: Archivo con la matriz de costos (primera fila con las etiquetas de los nodos)
+
+    Retorna:
+    - Modelo de pyomo
+"""
+def crearMTSP(ruta=os.path.join(DIRECTORIO, "proof_case.csv")):
+    matriz = pd.read_csv(ruta, header = None, delimiter = ',').iloc[1:].astype(float).values
+    n = len(matriz)
+
+    M = ConcreteModel()
+    M.nodos = RangeSet(0, n - 1)
+    M.equipos = Param(within = PositiveIntegers, initialize = 3, mutable = True)
+    M.costo = Param(M.nodos, M.nodos, within = NonNegativeReals, initialize = lambda M, i, j: matriz[i, j], mutable = True)
+
+    M.asignacion = Var(M.nodos, M.nodos, domain = Binary)
+    M.posicion = Var(M.nodos, domain = NonNegativeIntegers)
+
+    M.objetivo = Objective(expr = sum(M.asignacion[i, j] * M.costo[i, j] for i in M.nodos for j in M.nodos), sense = minimize)
+    M.autociclo = Constraint(M.nodos, rule = lambda M, i: M.asignacion[i, i] == 0)
+    M.equiposSalientes = Constraint(expr = sum(M.asignacion[0, j] for j in M.nodos) == M.equipos)
+    M.equiposEntrantes = Constraint(expr = sum(M.asignacion[i, 0] for i in M.nodos) == M.equipos)
+    M.unicaEntrada = Constraint(M.nodos, rule = lambda M, j: Constraint.Skip if j == 0 else sum(M.asignacion[i, j] for i in M.nodos) == 1)
+    M.unicaSalida = Constraint(M.nodos, rule = lambda M, i: Constraint.Skip if i == 0 else sum(M.asignacion[i, j] for j in M.nodos) == 1)
+    M.subtours = Constraint(M.nodos, M.nodos, rule = lambda M, i, j: Constraint.Skip if i == j or min(i, j) == 0 else
+                            M.posicion[i] - M.posicion[j] + n * M.asignacion[i, j] <= n - 1)
+    return M
+
+
+"""
+    Construye el modelo de ubicación de sensores de punto3.py con los costos y la cobertura requerida como parámetros mutables
+
+    Parámetros:
+    - directorio: Carpeta con los archivos CSV del problema
+
+    Retorna:
+    - Modelo de pyomo
+"""
+def crearSensores(directorio=DIRECTORIO):
+    comunicaciones = pd.read_csv(os.path.join(directorio, "communication_costs.csv"), delimiter = ',')
+    energias = pd.read_csv(os.path.join(directorio, "energy_consumption.csv"), delimiter = ',')
+    instalaciones = pd.read_csv(os.path.join(directorio, "installation_costs.csv"), delimiter = ',')
+    coberturas = pd.read_csv(os.path.join(directorio, "sensor_coverage.csv"), delimiter = ',')
+    adyacencia = pd.read_csv(os.path.join(directorio, "zone_coverage.csv"), header = None, delimiter = ',').iloc[1:].astype(int).values
+    numeroUbicaciones = len(instalaciones)
+
+    M = ConcreteModel()
+    M.sensores = RangeSet(0, len(energias) - 1)
+    M.ubicaciones = RangeSet(0, numeroUbicaciones - 1)
+    M.nombreSensores = list(energias["SensorType"])
+    M.nombreUbicaciones = list(instalaciones["Location"])
+
+    M.energia = Param(M.sensores, within = NonNegativeReals, initialize = lambda M, s: energias["EnergyConsumption"][s], mutable = True)
+    M.instalacion = Param(M.ubicaciones, within = NonNegativeReals, initialize = lambda M, u: instalaciones["InstallationCost"][u], mutable = True)
+    M.comunicacion = Param(M.sensores, M.ubicaciones, within = NonNegativeReals,
+                           initialize = lambda M, s, u: comunicaciones["CommunicationCost"][s * numeroUbicaciones + u], mutable = True)
+    M.requerido = Param(M.ubicaciones, M.sensores, within = NonNegativeReals, initialize = lambda M, u, s: coberturas[f"S{s+1}"][u], mutable = True)
+
+    M.asignacion = Var(M.sensores, M.ubicaciones, domain = Binary)
+
+    M.objetivo = Objective(expr = sum((M.energia[s] + M.comunicacion[s, u] + M.instalacion[u]) * M.asignacion[s, u] for s in M.sensores for u in M.ubicaciones), sense = minimize)
+    M.cobertura = Constraint(M.ubicaciones, M.sensores, rule = lambda M, u, s:
+                             sum(adyacencia[u][v] * M.asignacion[s, v] for v in M.ubicaciones) >= M.requerido[u, s])
+    return M
+
+
+"""
+    Extrae la solución del modelo de transporte, con los precios sombra de la oferta y la demanda (signo de punto1.py)
+"""
+def solucionTransporte(M):
+    dual = lambda restriccion: None if M.dual.get(restriccion) is None else -M.dual[restriccion]
+    return {
+        'costo': float(value(M.obj)),
+        'desdeBogota': {ciudadPorIndice[c]: M.toneladasDesdeBogota[c].value for c in M.ciudades},
+        'desdeMedellin': {ciudadPorIndice[c]: M.toneladasDesdeMedellin[c].value for c in M.ciudades},
+        'duales': {
+            'ofertaBogota': dual(M.ofertaDesdeBogota),
+            'ofertaMedellin': dual(M.ofertaDesdeMedellin),
+            'demanda': {ciudadPorIndice[c]: dual(M.demandaPorCiudad[c]) for c in M.ciudades}
+        }
+    }
+
+
+"""
+    Extrae la solución del MTSP: costo y arcos seleccionados
+"""
+def solucionMTSP(M):
+    return {'costo': float(value(M.objetivo)), 'arcos': [[i, j] for i in M.nodos for j in M.nodos if M.asignacion[i, j].value > 0.5]}
+
+
+"""
+    Extrae la solución de la ubicación de sensores: costo y ubicaciones de cada tipo de sensor
+"""
+def solucionSensores(M):
+    return {'costo': float(value(M.objetivo)),
+            'ubicaciones': {M.nombreSensores[s]: [M.nombreUbicaciones[u] for u in M.ubicaciones if M.asignacion[s, u].value > 0.5] for s in M.sensores}}
+
+
+MODELOS = {
+    'transporte': (crearTransporte, solucionTransporte),
+    'mtsp': (crearMTSP, solucionMTSP),
+    'sensores': (crearSensores, solucionSensores)
+}
+
+
+"""
+    Convierte un índice recibido como texto ("3" o "1,2") al índice del parámetro
+"""
+def indiceDesdeTexto(indice):
+    if isinstance(indice, str):
+        partes = tuple(int(parte) for parte in indice.split(','))
+        return partes[0] if len(partes) == 1 else partes
+    return tuple(indice) if isinstance(indice, list) else indice
+
+
+class ModelosCalientes:
+    """
+    Modelos construidos una vez que resuelven escenarios cambiando solo sus parámetros mutables
+    """
+
+    """
+    Construye los modelos y guarda los valores del caso base de sus parámetros
+
+    Parámetros:
+    - solver: Nombre del solver de pyomo
+    - modelos: Nombres de los modelos a construir (todos por defecto)
+    """
+    def __init__(self, solver='glpk', modelos=None):
+        self.solver = SolverFactory(solver)
+        self.modelos = {}
+        self.base = {}
+        for nombre in modelos or MODELOS:
+            crear, _ = MODELOS[nombre]
+            M = crear()
+            self.modelos[nombre] = M
+            self.base[nombre] = {p.local_name: {indice: value(p[indice]) for indice in p} for p in M.component_objects(Param)}
+        self.resueltos = 0
+
+    """
+    Asigna los cambios de un escenario a los parámetros del modelo
+
+    Retorna:
+    - Lista de (parámetro, índice) modificados, para restaurarlos
+    """
+    def aplicar(self, nombre, cambios):
+        M = self.modelos[nombre]
+        modificados = []
+        try:
+            for parametro, valores in cambios.items():
+                if parametro not in self.base[nombre]:
+                    raise ValueError(f"El modelo {nombre} no tiene el parámetro {parametro}")
+                p = getattr(M, parametro)
+                if not p.is_indexed():
+                    valores = {None: valores}
+                elif isinstance(valores, list):
+                    indices = self.base[nombre][parametro]
+                    if len(valores) != len(indices):
+                        raise ValueError(f"{parametro} tiene {len(indices)} valores y se recibieron {len(valores)}")
+                    valores = dict(zip(indices, valores))
+                for indice, valor in valores.items():
+                    indice = indiceDesdeTexto(indice)
+                    if indice not in self.base[nombre][parametro]:
+                        raise ValueError(f"Índice {indice} inválido para {parametro}")
+                    modificados.append((p, indice))
+                    p[indice] = valor
+        except Exception:
+            self.restaurar(nombre, modificados)
+            raise
+        return modificados
+
+    """
+    Devuelve los parámetros modificados a los valores del caso base
+    """
+    def restaurar(self, nombre, modificados):
+        base = self.base[nombre]
+        for p, indice in modificados:
+            p[indice] = base[p.local_name][indice]
+
+    """
+    Resuelve un escenario
+
+    Parámetros:
+    - nombre: Nombre del modelo ('transporte', 'mtsp' o 'sensores')
+    - cambios: Diccionario {parámetro: valor} relativo al caso base
+
+    Retorna:
+    - Diccionario con el estado del solver y la solución si es óptima
+    """
+    def resolver(self, nombre, cambios=None):
+        if nombre not in self.modelos:
+            raise ValueError(f"Modelo desconocido: {nombre}")
+        M = self.modelos[nombre]
+        modificados = self.aplicar(nombre, cambios or {})
+        try:
+            resultados = self.solver.solve(M, load_solutions=False)
+            self.resueltos += 1
+            estado = resultados.solver.termination_condition
+            if estado != TerminationCondition.optimal:
+                return {'estado': str(estado)}
+            M.solutions.load_from(resultados)
+            return {'estado': str(estado), **MODELOS[nombre][1](M)}
+        finally:
+            self.restaurar(nombre, modificados)
+
+    """
+    Resuelve una lista de escenarios [(nombre, cambios)]. Un escenario inválido produce un diccionario con 'error'
+    sin afectar a los demás
+    """
+    def resolverLote(self, escenarios):
+        respuestas = []
+        for nombre, cambios in escenarios:
+            try:
+                respuestas.append(self.resolver(nombre, cambios))
+            except (ValueError, TypeError, KeyError, AttributeError) as error:
+                respuestas.append({'error': str(error)})
+        return respuestas
+
+
+# Modelos del proceso trabajador (uno por proceso del grupo de trabajadores)
+modelosTrabajador = None
+
+
+"""
+    Inicializador de cada proceso trabajador: construye sus modelos una sola vez
+"""
+def iniciarTrabajador(solver, modelos=None):
+    global modelosTrabajador
+    modelosTrabajador = ModelosCalientes(solver, modelos)
+
+
+"""
+    Resuelve un lote de escenarios con los modelos del proceso trabajador
+
+    Retorna:
+    - Lista de respuestas e identificador del proceso que las resolvió
+"""
+def resolverEnTrabajador(escenarios):
+    respuestas = modelosTrabajador.resolverLote(escenarios)
+    return respuestas, os.getpid()
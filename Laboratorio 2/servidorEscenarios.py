@@ -0,0 +1,425 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Servidor local de escenarios para los modelos de transporte (punto1.py), MTSP
+(punto2.py) y ubicación de sensores (punto3.py). Responder una pregunta "¿qué pasa
+si?" con los scripts implica volver a leer los CSV, construir el modelo de pyomo y
+resolverlo; el servidor es un proceso de larga duración que construye los modelos
+una sola vez en cada proceso trabajador (modelosEscenarios.py) y solo cambia los
+parámetros de cada escenario.
+
+Protocolo HTTP sobre localhost (o un socket Unix), con cuerpos JSON:
+- POST /escenario  {"modelo": "transporte", "cambios": {"ofertaBogota": 600}}
+- POST /lote       [{"modelo": ..., "cambios": ...}, ...]
+- GET  /metricas   latencias p50/p99, rendimiento y contadores de lotes
+
+Las peticiones se encolan y un agrupador las junta en lotes: toma lo que llegue en
+una ventana corta (o todo lo acumulado mientras los trabajadores estaban ocupados)
+y envía cada lote a un proceso del grupo de trabajadores. Los escenarios idénticos
+que están en curso se resuelven una sola vez, y las respuestas recientes se
+guardan en memoria.
+
+Ejemplo:
+    python "Laboratorio 2/servidorEscenarios.py" --puerto 8765
+    curl -d '{"modelo": "mtsp", "cambios": {"equipos": 2}}' localhost:8765/escenario
+
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from modelosEscenarios import MODELOS, iniciarTrabajador, resolverEnTrabajador
+
+MENSAJES = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 500: 'Internal Server Error'}
+
+
+class ServidorEscenarios:
+    """
+    Servidor asyncio que agrupa peticiones concurrentes en lotes y los reparte entre procesos con modelos calientes
+    """
+
+    """
+    Inicializa el servidor
+
+    Parámetros:
+    - solver: Nombre del solver de pyomo que usan los trabajadores
+    - trabajadores: Número de procesos trabajadores
+    - tamañoLote: Máximo de escenarios por lote
+    - esperaLote: Segundos que el agrupador espera más peticiones antes de enviar un lote
+    - tamañoCache: Número de respuestas recientes que se guardan (0 para no guardar)
+    - ventana: Número de latencias recientes con las que se calculan los percentiles
+    """
+    def __init__(self, solver='glpk', trabajadores=2, tamañoLote=32, esperaLote=0.002, tamañoCache=1024, ventana=10000):
+        self.solver = solver
+        self.trabajadores = trabajadores
+        self.tamañoLote = tamañoLote
+        self.esperaLote = esperaLote
+        self.tamañoCache = tamañoCache
+        self.cache = OrderedDict()
+        self.pendientes = {}
+        self.latencias = deque(maxlen=ventana)
+        self.peticiones = 0
+        self.respondidas = 0
+        self.errores = 0
+        self.enCache = 0
+        self.coalescidas = 0
+        self.lotes = 0
+        self.resueltas = 0
+        self.tiempoSolver = 0.0
+        self.mayorLote = 0
+        self.porTrabajador = {}
+        self.grupo = None
+        self.servidor = None
+        self.tareas = set()
+        self.deteniendo = False
+
+    """
+    Crea el grupo de trabajadores, espera a que todos tengan sus modelos construidos y empieza a escuchar
+
+    Parámetros:
+    - host: Dirección en la que se escucha
+    - puerto: Puerto TCP (0 para uno libre)
+    - rutaSocket: Si se da, se escucha en este socket Unix en lugar de TCP
+    """
+    async def iniciar(self, host='127.0.0.1', puerto=8765, rutaSocket=None):
+        loop = asyncio.get_running_loop()
+        self.grupo = ProcessPoolExecutor(self.trabajadores, initializer=iniciarTrabajador, initargs=(self.solver,))
+        # Un lote vacío por trabajador para que los procesos arranquen y construyan sus modelos antes de la primera petición
+        await asyncio.gather(*(loop.run_in_executor(self.grupo, resolverEnTrabajador, []) for _ in range(self.trabajadores)))
+        self.cola = asyncio.Queue()
+        self.libres = asyncio.Semaphore(self.trabajadores)
+        self.inicio = time.perf_counter()
+        self.agrupador = asyncio.create_task(self.agrupar())
+        self.rutaSocket = rutaSocket
+        if rutaSocket is not None:
+            self.servidor = await asyncio.start_unix_server(self.atender, path=rutaSocket)
+        else:
+            self.servidor = await asyncio.start_server(self.atender, host, puerto)
+        return self.servidor
+
+    """
+    Deja de escuchar, espera los lotes en curso, responde con error las peticiones que no alcanzaron a entrar
+    en un lote y termina los procesos trabajadores
+    """
+    async def detener(self):
+        self.deteniendo = True
+        self.servidor.close()
+        await self.servidor.wait_closed()
+        self.agrupador.cancel()
+        await asyncio.gather(self.agrupador, *self.tareas, return_exceptions=True)
+        for futuro in self.pendientes.values():
+            if not futuro.done():
+                futuro.set_result({'error': 'El servidor se detuvo antes de resolver el escenario'})
+        self.pendientes.clear()
+        # shutdown espera a que terminen los procesos, por lo que se ejecuta fuera del loop de eventos
+        await asyncio.get_running_loop().run_in_executor(None, lambda: self.grupo.shutdown(cancel_futures=True))
+        if self.rutaSocket is not None and os.path.exists(self.rutaSocket):
+            os.remove(self.rutaSocket)
+
+    """
+    Resuelve un escenario a través de la cola de lotes
+
+    Parámetros:
+    - modelo: Nombre del modelo
+    - cambios: Diccionario de cambios sobre el caso base
+
+    Retorna:
+    - Respuesta del trabajador (estado y solución, o 'error')
+    """
+    async def consultar(self, modelo, cambios=None):
+        inicio = time.perf_counter()
+        self.peticiones += 1
+        clave = (modelo, json.dumps(cambios or {}, sort_keys=True))
+        if clave in self.cache:
+            self.cache.move_to_end(clave)
+            self.enCache += 1
+            respuesta = self.cache[clave]
+        else:
+            if clave in self.pendientes:
+                self.coalescidas += 1
+                futuro = self.pendientes[clave]
+            elif self.deteniendo:
+                futuro = asyncio.get_running_loop().create_future()
+                futuro.set_result({'error': 'El servidor se está deteniendo'})
+            else:
+                futuro = asyncio.get_running_loop().create_future()
+                self.pendientes[clave] = futuro
+                self.cola.put_nowait((clave, futuro))
+            respuesta = await asyncio.shield(futuro)
+        self.respondidas += 1
+        self.errores += 'error' in respuesta
+        self.latencias.append(time.perf_counter() - inicio)
+        return respuesta
+
+    """
+    Junta las peticiones de la cola en lotes. Solo arma un lote cuando hay un trabajador libre, por lo que con
+    los trabajadores ocupados las peticiones se acumulan y el siguiente lote es más grande
+    """
+    async def agrupar(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self.libres.acquire()
+            lote = [await self.cola.get()]
+            limite = loop.time() + self.esperaLote
+            while len(lote) < self.tamañoLote:
+                if self.cola.empty():
+                    restante = limite - loop.time()
+                    if restante <= 0:
+                        break
+                    try:
+                        lote.append(await asyncio.wait_for(self.cola.get(), restante))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    lote.append(self.cola.get_nowait())
+            tarea = asyncio.create_task(self.despachar(lote))
+            self.tareas.add(tarea)
+            tarea.add_done_callback(self.tareas.discard)
+
+    """
+    Envía un lote a un proceso trabajador y entrega cada respuesta a las peticiones que la esperan
+    """
+    async def despachar(self, lote):
+        loop = asyncio.get_running_loop()
+        inicio = time.perf_counter()
+        try:
+            escenarios = [(modelo, json.loads(cambios)) for (modelo, cambios), _ in lote]
+            respuestas, trabajador = await loop.run_in_executor(self.grupo, resolverEnTrabajador, escenarios)
+        except Exception as error:
+            respuestas = [{'error': f'Falla del trabajador: {error!r}'}] * len(lote)
+        else:
+            self.porTrabajador[trabajador] = self.porTrabajador.get(trabajador, 0) + len(lote)
+            self.resueltas += len(lote)
+        finally:
+            self.libres.release()
+        self.lotes += 1
+        self.mayorLote = max(self.mayorLote, len(lote))
+        self.tiempoSolver += time.perf_counter() - inicio
+        for (clave, futuro), respuesta in zip(lote, respuestas):
+            del self.pendientes[clave]
+            if self.tamañoCache and 'error' not in respuesta:
+                self.cache[clave] = respuesta
+                if len(self.cache) > self.tamañoCache:
+                    self.cache.popitem(last=False)
+            futuro.set_result(respuesta)
+
+    """
+    Retorna las métricas del servidor: percentiles de latencia (ms) de las últimas peticiones, rendimiento
+    (peticiones por segundo desde el inicio) y contadores de lotes, cache y escenarios coalescidos
+    """
+    def metricas(self):
+        latencias = np.array(self.latencias) * 1000
+        transcurrido = time.perf_counter() - self.inicio
+        return {
+            'peticiones': self.peticiones,
+            'respondidas': self.respondidas,
+            'errores': self.errores,
+            'enCurso': len(self.pendientes),
+            'latenciaP50': float(np.percentile(latencias, 50)) if len(latencias) else None,
+            'latenciaP99': float(np.percentile(latencias, 99)) if len(latencias) else None,
+            'latenciaMaxima': float(latencias.max()) if len(latencias) else None,
+            'rendimiento': self.respondidas / transcurrido if transcurrido > 0 else 0.0,
+            'lotes': self.lotes,
+            'escenariosPorLote': self.resueltas / self.lotes if self.lotes else 0.0,
+            'mayorLote': self.mayorLote,
+            'resueltas': self.resueltas,
+            'enCache': self.enCache,
+            'coalescidas': self.coalescidas,
+            'tiempoPorLote': 1000 * self.tiempoSolver / self.lotes if self.lotes else 0.0,
+            'porTrabajador': {str(pid): n for pid, n in self.porTrabajador.items()},
+            'segundos': transcurrido
+        }
+
+    """
+    Valida el cuerpo de una petición de escenario y lo resuelve
+    """
+    async def escenario(self, cuerpo):
+        if not isinstance(cuerpo, dict) or cuerpo.get('modelo') not in MODELOS:
+            return 400, {'error': f"Se espera {{'modelo': ..., 'cambios': {{...}}}} con modelo en {list(MODELOS)}"}
+        cambios = cuerpo.get('cambios') or {}
+        if not isinstance(cambios, dict):
+            return 400, {'error': "'cambios' debe ser un diccionario"}
+        respuesta = await self.consultar(cuerpo['modelo'], cambios)
+        return (400 if 'error' in respuesta else 200), respuesta
+
+    """
+    Atiende una conexión HTTP/1.1 (con keep-alive) hasta que el cliente la cierre
+    """
+    async def atender(self, lector, escritor):
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                metodo, ruta, _ = linea.decode('latin-1').split(' ', 2)
+                encabezados = {}
+                while (linea := await lector.readline()) not in (b'\r\n', b'\n', b''):
+                    nombre, _, valor = linea.decode('latin-1').partition(':')
+                    encabezados[nombre.strip().lower()] = valor.strip()
+                datos = await lector.readexactly(int(encabezados.get('content-length', 0)))
+
+                try:
+                    cuerpo = json.loads(datos) if datos else None
+                    if metodo == 'GET' and ruta == '/metricas':
+                        estado, respuesta = 200, self.metricas()
+                    elif metodo == 'POST' and ruta == '/escenario':
+                        estado, respuesta = await self.escenario(cuerpo)
+                    elif metodo == 'POST' and ruta == '/lote' and isinstance(cuerpo, list):
+                        resultados = await asyncio.gather(*(self.escenario(c) for c in cuerpo))
+                        estado, respuesta = 200, [r for _, r in resultados]
+                    else:
+                        estado, respuesta = 404, {'error': f'Ruta desconocida: {metodo} {ruta}'}
+                except json.JSONDecodeError as error:
+                    estado, respuesta = 400, {'error': f'JSON inválido: {error}'}
+
+                contenido = json.dumps(respuesta, ensure_ascii=False).encode()
+                cerrar = encabezados.get('connection', '').lower() == 'close'
+                escritor.write(f'HTTP/1.1 {estado} {MENSAJES[estado]}\r\nContent-Type: application/json\r\n'
+                               f'Content-Length: {len(contenido)}\r\nConnection: {"close" if cerrar else "keep-alive"}\r\n\r\n'.encode() + contenido)
+                await escritor.drain()
+                if cerrar:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+
+"""
+    Cliente mínimo: envía una petición por una conexión abierta y lee la respuesta
+
+    Parámetros:
+    - lector, escritor: Conexión abierta con asyncio.open_connection
+    - metodo: 'GET' o 'POST'
+    - ruta: Ruta de la petición
+    - cuerpo: Objeto que se envía como JSON (opcional)
+
+    Retorna:
+    - Código de estado y respuesta decodificada
+"""
+async def solicitar(lector, escritor, metodo, ruta, cuerpo=None):
+    datos = b'' if cuerpo is None else json.dumps(cuerpo).encode()
+    escritor.write(f'{metodo} {ruta} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n'
+                   f'Content-Length: {len(datos)}\r\n\r\n'.encode() + datos)
+    await escritor.drain()
+    estado = int((await lector.readline()).split()[1])
+    encabezados = {}
+    while (linea := await lector.readline()) not in (b'\r\n', b''):
+        nombre, _, valor = linea.decode('latin-1').partition(':')
+        encabezados[nombre.strip().lower()] = valor.strip()
+    return estado, json.loads(await lector.readexactly(int(encabezados['content-length'])))
+
+
+"""
+    Genera escenarios aleatorios alrededor del caso base de los tres modelos
+
+    Parámetros:
+    - n: Número de escenarios
+    - distintos: Número de escenarios distintos (los demás se repiten, como en una herramienta interactiva)
+    - semilla: Semilla del generador
+"""
+def escenariosAleatorios(n, distintos=None, semilla=0):
+    generador = random.Random(semilla)
+    base = []
+    for _ in range(distintos or n):
+        modelo = generador.choice(list(MODELOS))
+        if modelo == 'transporte':
+            cambios = {'ofertaBogota': generador.randint(500, 700), 'ofertaMedellin': generador.randint(600, 800),
+                       'demanda': {str(generador.randrange(6)): generador.randint(100, 300)}}
+        elif modelo == 'mtsp':
+            cambios = {'equipos': generador.randint(1, 4), 'costo': {f'{generador.randrange(6)},{generador.randrange(6)}': generador.randint(1, 5)}}
+        else:
+            cambios = {'instalacion': {str(generador.randrange(12)): generador.randint(50, 300)},
+                       'energia': {str(generador.randrange(3)): generador.randint(1, 10)}}
+        base.append({'modelo': modelo, 'cambios': cambios})
+    return [base[i % len(base)] for i in range(n)] if distintos else base
+
+
+"""
+    Prueba de carga: varios clientes concurrentes envían escenarios por conexiones keep-alive
+
+    Parámetros:
+    - host, puerto: Dirección del servidor
+    - escenarios: Lista de cuerpos de /escenario
+    - clientes: Número de clientes concurrentes
+
+    Retorna:
+    - Métricas del servidor al terminar
+"""
+async def pruebaDeCarga(host, puerto, escenarios, clientes=16):
+    pendientes = deque(escenarios)
+
+    async def cliente():
+        lector, escritor = await asyncio.open_connection(host, puerto)
+        while pendientes:
+            estado, respuesta = await solicitar(lector, escritor, 'POST', '/escenario', pendientes.popleft())
+            if estado != 200:
+                print(estado, respuesta)
+        escritor.close()
+        await escritor.wait_closed()
+
+    await asyncio.gather(*(cliente() for _ in range(clientes)))
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    _, metricas = await solicitar(lector, escritor, 'GET', '/metricas')
+    escritor.close()
+    await escritor.wait_closed()
+    return metricas
+
+
+async def ejecutar(argumentos):
+    servidor = ServidorEscenarios(argumentos.solver, argumentos.trabajadores, argumentos.tamanoLote, argumentos.esperaLote / 1000)
+    inicio = time.perf_counter()
+    if argumentos.prueba:
+        sockets = await servidor.iniciar(argumentos.host, 0)
+    else:
+        sockets = await servidor.iniciar(argumentos.host, argumentos.puerto, argumentos.socket)
+    print(f"Modelos construidos en {argumentos.trabajadores} trabajadores en {time.perf_counter() - inicio:.2f} s")
+
+    if argumentos.prueba:
+        puerto = sockets.sockets[0].getsockname()[1]
+        escenarios = escenariosAleatorios(argumentos.prueba, argumentos.distintos)
+        metricas = await pruebaDeCarga(argumentos.host, puerto, escenarios, argumentos.clientes)
+        await servidor.detener()
+        print(f"{metricas['respondidas']} escenarios en {metricas['segundos']:.2f} s ({metricas['rendimiento']:.1f} por segundo)")
+        print(f"Latencia p50 = {metricas['latenciaP50']:.1f} ms, p99 = {metricas['latenciaP99']:.1f} ms, máxima = {metricas['latenciaMaxima']:.1f} ms")
+        print(f"{metricas['lotes']} lotes, {metricas['escenariosPorLote']:.1f} escenarios por lote (máximo {metricas['mayorLote']}), "
+              f"{metricas['enCache']} en cache, {metricas['coalescidas']} coalescidas, {metricas['errores']} errores")
+        return
+
+    print(f"Escuchando en {argumentos.socket or f'http://{argumentos.host}:{argumentos.puerto}'}")
+    # Con SIGTERM o Ctrl+C se cierra el servidor y se terminan también los procesos trabajadores
+    terminar = asyncio.Event()
+    for senal in (signal.SIGINT, signal.SIGTERM):
+        asyncio.get_running_loop().add_signal_handler(senal, terminar.set)
+    await terminar.wait()
+    await servidor.detener()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de escenarios para los modelos del Laboratorio 2")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--socket', default=None, help="Ruta de un socket Unix en lugar de TCP")
+    parser.add_argument('--solver', default='glpk')
+    parser.add_argument('--trabajadores', type=int, default=2)
+    parser.add_argument('--tamanoLote', type=int, default=32)
+    parser.add_argument('--esperaLote', type=float, default=2.0, help="Espera del agrupador en milisegundos")
+    parser.add_argument('--prueba', type=int, default=0, help="Ejecuta una prueba de carga con este número de escenarios y termina")
+    parser.add_argument('--distintos', type=int, default=None, help="Escenarios distintos en la prueba de carga")
+    parser.add_argument('--clientes', type=int, default=16)
+    asyncio.run(ejecutar(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
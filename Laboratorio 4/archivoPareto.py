@@ -0,0 +1,313 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Archivo de Pareto para los barridos multiobjetivo (epsilon-constraint y sumas
+ponderadas). En lugar de acumular (f1, f2) en listas, cada solución se inserta en
+un archivo que solo conserva los puntos no dominados, junto con el vector de
+decisión que los produjo:
+- Los duplicados y los puntos dominados se descartan al insertar.
+- Los puntos no finitos se descartan como artefactos, y también los que tienen
+  algún objetivo mayor o igual a la penalización si se indica una (por ejemplo
+  los 999 de las matrices de saltos y costos de punto 1.1.py).
+- Con dos objetivos el frente se guarda en listas ordenadas por el primer
+  objetivo. La posición de cada punto nuevo se encuentra con bisect en O(log n),
+  pero insertarlo o reemplazar el tramo que domina desplaza los elementos
+  siguientes de las listas, O(n) por inserción (un memmove, rápido para los
+  frentes de estos barridos). El hipervolumen se actualiza de forma incremental.
+- Con k objetivos se usa una comparación vectorizada con numpy y el hipervolumen
+  se calcula por cortes.
+
+Internamente todos los objetivos se minimizan: los que se maximizan se cambian de
+signo al entrar y al salir del archivo.
+
+"""
+
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+
+"""
+    Convierte valores al espacio de minimización (cambia el signo de los objetivos que se maximizan)
+    Parámetros:
+    - valores: arreglo de n x k (o un punto de k valores)
+    - sentidos: 'min' o 'max' por cada objetivo
+"""
+def aMinimizacion(valores, sentidos):
+    signos = np.array([1.0 if sentido == 'min' else -1.0 for sentido in sentidos])
+    return np.asarray(valores, dtype=float) * signos
+
+
+"""
+    Ordenamiento no dominado: separa los puntos en frentes (el primero es el frente de Pareto, el
+    segundo el frente de Pareto de los restantes, etc.). Con dos objetivos ordena los puntos y hace una
+    búsqueda binaria sobre el último punto de cada frente, O(n log n) (solo se reemplaza el último punto
+    de un frente o se agrega uno nuevo al final); con k objetivos compara todos los pares, O(k n²)
+    Parámetros:
+    - objetivos: arreglo de n x k con los valores de los objetivos
+    - sentidos: 'min' o 'max' por cada objetivo (por defecto todos se minimizan)
+    Retorna:
+    - Lista de frentes, cada uno una lista de índices de los puntos
+"""
+def ordenamientoNoDominado(objetivos, sentidos=None):
+    valores = np.asarray(objetivos, dtype=float)
+    if len(valores) == 0:
+        return []
+    valores = aMinimizacion(valores, sentidos or ['min'] * valores.shape[1])
+
+    if valores.shape[1] == 2:
+        frentes = []
+        ultimos = []
+        # En orden lexicográfico, un punto está dominado por un frente si el último punto del frente
+        # tiene menor f2 (o igual f2 y menor f1); esos últimos puntos crecen de un frente al siguiente
+        for i in np.lexsort((valores[:, 1], valores[:, 0])).tolist():
+            clave = (valores[i, 1], valores[i, 0])
+            frente = bisect_left(ultimos, clave)
+            if frente == len(frentes):
+                frentes.append([])
+                ultimos.append(clave)
+            frentes[frente].append(i)
+            ultimos[frente] = clave
+        return frentes
+
+    # domina[i, j] es True si el punto i domina al punto j
+    menoresOIguales = (valores[:, None, :] <= valores[None, :, :]).all(axis=2)
+    menores = (valores[:, None, :] < valores[None, :, :]).any(axis=2)
+    domina = menoresOIguales & menores
+    dominadores = domina.sum(axis=0)
+    frentes = []
+    actual = np.flatnonzero(dominadores == 0)
+    while len(actual):
+        frentes.append(actual.tolist())
+        dominadores[actual] = -1
+        dominadores -= domina[actual].sum(axis=0)
+        actual = np.flatnonzero(dominadores == 0)
+    return frentes
+
+
+"""
+    Calcula el hipervolumen (área, volumen, ...) dominado por un conjunto de puntos y acotado por
+    un punto de referencia, en el espacio de minimización. Con dos objetivos es un barrido sobre los
+    puntos ordenados; con más objetivos se corta por el último objetivo y se suman los hipervolúmenes
+    de dimensión k - 1 de cada corte
+    Parámetros:
+    - puntos: arreglo de n x k (minimización)
+    - referencia: punto de k valores peor que todos los puntos de interés
+    Retorna:
+    - Hipervolumen
+"""
+def hipervolumen(puntos, referencia):
+    referencia = np.asarray(referencia, dtype=float)
+    puntos = np.asarray(puntos, dtype=float).reshape(-1, len(referencia))
+    puntos = puntos[(puntos < referencia).all(axis=1)]
+    if len(puntos) == 0:
+        return 0.0
+    if len(referencia) == 1:
+        return float(referencia[0] - puntos[:, 0].min())
+    if len(referencia) == 2:
+        puntos = puntos[np.lexsort((puntos[:, 1], puntos[:, 0]))]
+        # Solo cuentan los puntos que bajan el mínimo de f2 visto hasta ahora
+        minimos = np.minimum.accumulate(puntos[:, 1])
+        escalones = np.concatenate(([True], minimos[1:] < minimos[:-1]))
+        xs, ys = puntos[escalones, 0], minimos[escalones]
+        return float(np.sum((np.append(xs[1:], referencia[0]) - xs) * (referencia[1] - ys)))
+    orden = np.argsort(puntos[:, -1])
+    puntos = puntos[orden]
+    cortes = np.append(puntos[1:, -1], referencia[-1])
+    total = 0.0
+    for i in range(len(puntos)):
+        if cortes[i] > puntos[i, -1]:
+            total += hipervolumen(puntos[:i + 1, :-1], referencia[:-1]) * (cortes[i] - puntos[i, -1])
+    return total
+
+
+class ArchivoPareto:
+
+    """
+        Inicializa un archivo vacío
+        Parámetros:
+        - sentidos: 'min' o 'max' por cada objetivo (por ejemplo ('min', 'min') para saltos y costos)
+        - referencia: punto de referencia del hipervolumen en el sentido original de los objetivos (opcional)
+        - penalizacion: los puntos con algún objetivo de valor absoluto mayor o igual se descartan (por defecto no se filtra)
+    """
+    def __init__(self, sentidos=('min', 'min'), referencia=None, penalizacion=None):
+        self.sentidos = tuple(sentidos)
+        self.k = len(self.sentidos)
+        self.signos = aMinimizacion(np.ones(self.k), self.sentidos)
+        self.referencia = None if referencia is None else aMinimizacion(referencia, self.sentidos)
+        self.penalizacion = penalizacion
+        # Frente en el espacio de minimización; con dos objetivos xs crece y ys decrece estrictamente
+        self.xs = []
+        self.ys = []
+        self.valores = []
+        self.decisiones = []
+        self.volumen = 0.0
+        # Contadores de lo que llega al archivo
+        self.insertados = 0
+        self.dominados = 0
+        self.duplicados = 0
+        self.penalizados = 0
+        self.reemplazados = 0
+
+    def __len__(self):
+        return len(self.decisiones)
+
+    """
+        Área de la franja [x, siguiente) x [y, referencia) que aporta un punto del frente de dos objetivos
+    """
+    def franja(self, x, y, siguiente):
+        if self.referencia is None:
+            return 0.0
+        rx, ry = self.referencia
+        return max(0.0, min(siguiente, rx) - min(x, rx)) * max(0.0, ry - y)
+
+    """
+        Área que aportan los puntos del frente de dos objetivos entre los índices inicio y fin (sin incluir)
+    """
+    def areaTramo(self, inicio, fin):
+        area = 0.0
+        for i in range(max(inicio, 0), fin):
+            siguiente = self.xs[i + 1] if i + 1 < len(self.xs) else np.inf
+            area += self.franja(self.xs[i], self.ys[i], siguiente)
+        return area
+
+    """
+        Inserta un punto en el frente de dos objetivos. El punto con mayor f1 menor o igual al nuevo tiene
+        el menor f2 entre ellos: si no es peor que el nuevo, el nuevo está dominado o repetido. Los puntos
+        que el nuevo domina forman un tramo contiguo a su derecha. Ubicar el punto es O(log n), pero la
+        asignación por tramos desplaza el resto de las listas, O(n)
+    """
+    def insertar2D(self, x, y, decision):
+        posicion = bisect_right(self.xs, x)
+        if posicion > 0 and self.ys[posicion - 1] <= y:
+            if self.xs[posicion - 1] == x and self.ys[posicion - 1] == y:
+                self.duplicados += 1
+            else:
+                self.dominados += 1
+            return False
+        inicio = bisect_left(self.xs, x, 0, posicion)
+        fin = inicio
+        while fin < len(self.xs) and self.ys[fin] >= y:
+            fin += 1
+        # El hipervolumen cambia solo en el predecesor, los puntos reemplazados y el nuevo punto
+        self.volumen -= self.areaTramo(inicio - 1, fin)
+        self.reemplazados += fin - inicio
+        self.xs[inicio:fin] = [x]
+        self.ys[inicio:fin] = [y]
+        self.decisiones[inicio:fin] = [decision]
+        self.volumen += self.areaTramo(inicio - 1, inicio + 1)
+        return True
+
+    """
+        Inserta un punto en el frente de k objetivos comparándolo con todos los puntos del archivo
+    """
+    def insertarKD(self, valor, decision):
+        if self.valores:
+            frente = np.array(self.valores)
+            if (frente == valor).all(axis=1).any():
+                self.duplicados += 1
+                return False
+            if (frente <= valor).all(axis=1).any():
+                self.dominados += 1
+                return False
+            dominadosPorNuevo = (valor <= frente).all(axis=1)
+            self.reemplazados += int(dominadosPorNuevo.sum())
+            conservar = np.flatnonzero(~dominadosPorNuevo).tolist()
+            self.valores = [self.valores[i] for i in conservar]
+            self.decisiones = [self.decisiones[i] for i in conservar]
+        self.valores.append(valor)
+        self.decisiones.append(decision)
+        self.volumen = None
+        return True
+
+    """
+        Agrega una solución al archivo si no es un artefacto de penalización, un duplicado ni está dominada
+        Parámetros:
+        - objetivos: valores de los k objetivos en su sentido original
+        - decision: vector de decisión que produjo la solución (cualquier objeto, por ejemplo los enlaces elegidos)
+        Retorna:
+        - True si la solución entró al archivo
+    """
+    def agregar(self, objetivos, decision=None):
+        objetivos = np.asarray(objetivos, dtype=float)
+        if not np.isfinite(objetivos).all() or (
+                self.penalizacion is not None and (np.abs(objetivos) >= self.penalizacion).any()):
+            self.penalizados += 1
+            return False
+        valor = objetivos * self.signos
+        insertado = self.insertar2D(valor[0], valor[1], decision) if self.k == 2 else self.insertarKD(valor, decision)
+        self.insertados += insertado
+        return insertado
+
+    """
+        Agrega varias soluciones
+        Parámetros:
+        - objetivos: lista de puntos de k valores
+        - decisiones: lista de vectores de decisión (opcional)
+        Retorna:
+        - Número de soluciones que entraron al archivo
+    """
+    def agregarTodos(self, objetivos, decisiones=None):
+        decisiones = decisiones if decisiones is not None else [None] * len(objetivos)
+        return sum(self.agregar(punto, decision) for punto, decision in zip(objetivos, decisiones))
+
+    """
+        Retorna un arreglo de n x k con los puntos del frente en el sentido original de los objetivos
+        (con dos objetivos, ordenados por el primer objetivo en el espacio de minimización)
+    """
+    def objetivos(self):
+        valores = np.column_stack((self.xs, self.ys)) if self.k == 2 else np.array(self.valores)
+        return valores.reshape(-1, self.k) * self.signos
+
+    """
+        Retorna la lista de pares (objetivos, decisión) del frente
+    """
+    def puntos(self):
+        return list(zip(map(tuple, self.objetivos().tolist()), self.decisiones))
+
+    """
+        Cambia el punto de referencia del hipervolumen (en el sentido original de los objetivos) y lo recalcula
+    """
+    def fijarReferencia(self, referencia):
+        self.referencia = aMinimizacion(referencia, self.sentidos)
+        self.volumen = hipervolumen(self.objetivos() * self.signos, self.referencia)
+
+    """
+        Retorna el hipervolumen del frente respecto al punto de referencia (incremental con dos objetivos)
+    """
+    def hipervolumen(self):
+        if self.referencia is None:
+            raise ValueError("El archivo no tiene punto de referencia para el hipervolumen")
+        if self.volumen is None:
+            self.volumen = hipervolumen(self.objetivos() * self.signos, self.referencia)
+        return float(self.volumen)
+
+    """
+        Retorna un diccionario con el tamaño del frente, su hipervolumen y los contadores de descartes
+    """
+    def resumen(self):
+        return {
+            'puntos': len(self), 'hipervolumen': self.hipervolumen() if self.referencia is not None else None,
+            'insertados': self.insertados, 'reemplazados': self.reemplazados, 'dominados': self.dominados,
+            'duplicados': self.duplicados, 'penalizados': self.penalizados
+        }
+
+
+"""
+    Cobertura de conjuntos C(A, B): fracción de los puntos del archivo B que son iguales o están
+    dominados por algún punto del archivo A. C(A, B) = 1 indica que A cubre por completo a B
+    Parámetros:
+    - archivoA, archivoB: archivos de Pareto con los mismos sentidos
+    - tolerancia: diferencia absoluta en cada objetivo que se considera igual (por la precisión del solver)
+    Retorna:
+    - Fracción entre 0 y 1 (0 si B está vacío)
+"""
+def cobertura(archivoA, archivoB, tolerancia=0.0):
+    if len(archivoA) == 0 or len(archivoB) == 0:
+        return 0.0
+    a = archivoA.objetivos() * archivoA.signos
+    b = archivoB.objetivos() * archivoB.signos
+    cubiertos = (a[:, None, :] <= b[None, :, :] + tolerancia).all(axis=2).any(axis=0)
+    return float(cubiertos.mean())
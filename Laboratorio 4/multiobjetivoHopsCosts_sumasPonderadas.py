@@ -12,6 +12,9 @@ Script que calcula el Frente de Pareto (metodo de suma ponderada) de dos funcion
 #Plot Imports
 import matplotlib.pyplot as plt
 
+#Archivo de Pareto
+from archivoPareto import ArchivoPareto
+
 #Pyomo Imports (Modelo Matematico)
 from pyomo.environ import *
 from pyomo.opt import SolverFactory
@@ -111,6 +114,9 @@ Model.f2 = sum(Model.x[i,j] * Model.c[i,j] for i in Model.N for j in Model.N)
 cont=-1
 f1_vec=[]
 f2_vec=[]
+#Las sumas ponderadas repiten puntos extremos: el archivo los descarta
+costoMaximo = sum(value(Model.c[i,j]) for i in Model.N for j in Model.N if value(Model.c[i,j]) < 999)
+archivo = ArchivoPareto(sentidos=('min', 'min'), referencia=(numNodes, costoMaximo), penalizacion=999)
 for k in w2_vec:
     cont=cont+1
     w2=w2_vec[cont]
@@ -153,6 +159,7 @@ for k in w2_vec:
     valorF2=value(Model.f2)
     f1_vec.append(valorF1)
     f2_vec.append(valorF2)
+    archivo.agregar((valorF1, valorF2), [(i,j) for i in Model.N for j in Model.N if value(Model.x[i,j]) > 0.5])
     
     delete_component(Model, 'O_z')
     delete_component(Model, 'source')
@@ -161,7 +168,9 @@ for k in w2_vec:
     
     #end for
 
-plt.plot(f1_vec,f2_vec,'o-.');
+print(archivo.resumen())
+frente = archivo.objetivos()
+plt.plot(frente[:,0],frente[:,1],'o-.');
 plt.title('Frente ptimo de Pareto');
 plt.xlabel('F1')
 plt.ylabel('F2')
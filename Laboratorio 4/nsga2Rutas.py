@@ -0,0 +1,473 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+NSGA-II para el problema biobjetivo de rutas de punto 1.1.py (minimizar saltos y
+costos de un camino del nodo origen al nodo destino). El método epsilon-constraint
+resuelve un MIP por cada punto de la frontera; NSGA-II obtiene una aproximación de
+toda la frontera en una sola ejecución, incluso en grafos de miles de nodos.
+
+Codificación: cada individuo es un vector real con un peso lambda entre 0 y 1 y
+una llave por nodo. Para decodificarlo se busca el camino más corto (Dijkstra) con
+el peso de cada enlace (i, j):
+
+    (lambda * h[i,j] / h medio + (1 - lambda) * c[i,j] / c medio) * exp(sigma * llave[j])
+
+Todo vector decodifica a un camino simple válido, por lo que el cruce uniforme y
+la mutación gaussiana se aplican a toda la población de una vez con numpy. Las
+llaves permiten llegar también a puntos que ninguna suma ponderada encuentra.
+
+Se reutilizan el ordenamiento no dominado y el archivo de Pareto de
+archivoPareto.py. La ejecución se detiene cuando el hipervolumen del archivo deja
+de crecer durante K generaciones; como el archivo nunca pierde puntos no
+dominados, el hipervolumen no decrece y basta con seguir su máximo.
+
+"""
+
+import argparse
+import heapq
+import random
+import time
+
+import numpy as np
+
+from archivoPareto import ArchivoPareto, cobertura, ordenamientoNoDominado
+
+
+"""
+    Convierte las matrices de saltos y costos en la lista de enlaces, omitiendo los enlaces penalizados
+    Parámetros:
+    - h: matriz de saltos (arreglo de n x n, o diccionario {(i, j): valor} como Model.h)
+    - c: matriz de costos con el mismo formato
+    - penalizacion: los enlaces con saltos o costo mayor o igual no existen
+    Retorna:
+    - Lista de tuplas (i, j, saltos, costo)
+"""
+def aristasDesdeMatrices(h, c, penalizacion=999):
+    if isinstance(h, dict):
+        pares = [(i, j, h[i, j], c[i, j]) for i, j in h]
+    else:
+        h, c = np.asarray(h, dtype=float), np.asarray(c, dtype=float)
+        pares = [(i, j, h[i, j], c[i, j]) for i in range(len(h)) for j in range(len(h))]
+    return [(i, j, float(saltos), float(costo)) for i, j, saltos, costo in pares
+            if saltos < penalizacion and costo < penalizacion]
+
+
+class GrafoRutas:
+
+    """
+        Crea el grafo dirigido a partir de la lista de enlaces
+        Parámetros:
+        - aristas: lista de tuplas (i, j, saltos, costo); los nodos pueden tener cualquier etiqueta
+    """
+    def __init__(self, aristas):
+        self.aristas = list(aristas)
+        self.nodos = sorted({i for i, _, _, _ in self.aristas} | {j for _, j, _, _ in self.aristas})
+        self.indices = {nodo: k for k, nodo in enumerate(self.nodos)}
+        # Enlaces salientes de cada nodo como (vecino, número de enlace)
+        self.salientes = [[] for _ in self.nodos]
+        for k, (i, j, _, _) in enumerate(self.aristas):
+            self.salientes[self.indices[i]].append((self.indices[j], k))
+        self.destinos = np.array([self.indices[j] for _, j, _, _ in self.aristas])
+        self.saltos = np.array([a[2] for a in self.aristas])
+        self.costos = np.array([a[3] for a in self.aristas])
+
+    def __len__(self):
+        return len(self.nodos)
+
+    """
+        Calcula los pesos de los enlaces de varios individuos de una vez
+        Parámetros:
+        - lams: peso de los saltos frente a los costos de cada individuo
+        - factores: arreglo de P x n con el factor de cada nodo (exp(sigma * llave))
+        Retorna:
+        - Arreglo de P x número de enlaces
+    """
+    def pesos(self, lams, factores):
+        lams = np.asarray(lams)[:, None]
+        base = lams * (self.saltos / self.saltos.mean()) + (1 - lams) * (self.costos / self.costos.mean())
+        return base * factores[:, self.destinos]
+
+    """
+        Camino más corto (Dijkstra con parada en el destino)
+        Parámetros:
+        - origen, destino: índices de los nodos
+        - pesos: peso de cada enlace, como lista
+        Retorna:
+        - Tupla (camino como tupla de índices, saltos, costo), o None si el destino no es alcanzable
+    """
+    def caminoMasCorto(self, origen, destino, pesos):
+        distancias = [np.inf] * len(self.nodos)
+        distancias[origen] = 0.0
+        anteriores = {origen: None}
+        cola = [(0.0, origen)]
+        while cola:
+            distancia, nodo = heapq.heappop(cola)
+            if nodo == destino:
+                break
+            if distancia > distancias[nodo]:
+                continue
+            for vecino, arista in self.salientes[nodo]:
+                nueva = distancia + pesos[arista]
+                if nueva < distancias[vecino]:
+                    distancias[vecino] = nueva
+                    anteriores[vecino] = arista
+                    heapq.heappush(cola, (nueva, vecino))
+        if destino not in anteriores:
+            return None
+        camino, aristas = [destino], []
+        while anteriores[camino[-1]] is not None:
+            aristas.append(anteriores[camino[-1]])
+            camino.append(self.indices[self.aristas[aristas[-1]][0]])
+        return tuple(reversed(camino)), float(self.saltos[aristas].sum()), float(self.costos[aristas].sum())
+
+    """
+        Retorna las etiquetas originales de los nodos de un camino de índices
+    """
+    def etiquetas(self, camino):
+        return tuple(self.nodos[k] for k in camino)
+
+
+"""
+    Genera un grafo geométrico aleatorio para probar la escala: los nodos se ubican en el cuadrado
+    unitario y cada uno se conecta (en ambos sentidos) con sus vecinos más cercanos, más algunos
+    atajos entre nodos al azar. Cada enlace es un salto y su costo crece con el cuadrado de la
+    distancia, así que los caminos con pocos saltos (enlaces largos) son costosos y los baratos
+    tienen muchos saltos
+    Parámetros:
+    - n: número de nodos
+    - vecinos: vecinos más cercanos de cada nodo
+    - atajos: número de atajos como fracción de n
+    - semilla: semilla de numpy
+    Retorna:
+    - Tupla (grafo, origen, destino) con el origen y el destino en esquinas opuestas
+"""
+def grafoAleatorio(n, vecinos=6, atajos=0.05, semilla=0):
+    generador = np.random.default_rng(semilla)
+    posiciones = generador.random((n, 2))
+    aristas = {}
+    # Los vecinos se buscan por bloques de filas para no crear la matriz de n x n completa
+    for inicio in range(0, n, 512):
+        bloque = posiciones[inicio:inicio + 512]
+        distancias = np.linalg.norm(bloque[:, None, :] - posiciones[None, :, :], axis=2)
+        cercanos = np.argpartition(distancias, vecinos, axis=1)[:, :vecinos + 1]
+        for fila, columnas in enumerate(cercanos.tolist()):
+            i = inicio + fila
+            for j in columnas:
+                if i != j:
+                    aristas[i, j] = aristas[j, i] = distancias[fila, j]
+    for i, j in generador.integers(0, n, size=(int(atajos * n), 2)).tolist():
+        if i != j:
+            aristas[i, j] = aristas[j, i] = float(np.linalg.norm(posiciones[i] - posiciones[j]))
+    origen = int(np.argmin(posiciones.sum(axis=1)))
+    destino = int(np.argmax(posiciones.sum(axis=1)))
+    return GrafoRutas([(i, j, 1.0, float(np.ceil(1000 * distancia ** 2)) + 1) for (i, j), distancia in aristas.items()]), origen, destino
+
+
+"""
+    Distancia de hacinamiento (crowding distance) de los puntos de un frente
+    Parámetros:
+    - objetivos: arreglo de m x k de los puntos del frente
+    Retorna:
+    - Arreglo con la distancia de cada punto (infinita en los extremos)
+"""
+def distanciaHacinamiento(objetivos):
+    m, k = objetivos.shape
+    distancias = np.zeros(m)
+    if m <= 2:
+        distancias[:] = np.inf
+        return distancias
+    for objetivo in range(k):
+        orden = np.argsort(objetivos[:, objetivo], kind='stable')
+        valores = objetivos[orden, objetivo]
+        distancias[orden[[0, -1]]] = np.inf
+        rango = valores[-1] - valores[0]
+        if rango > 0:
+            distancias[orden[1:-1]] += (valores[2:] - valores[:-2]) / rango
+    return distancias
+
+
+"""
+    Calcula el rango (número de frente) y la distancia de hacinamiento de cada punto
+    Parámetros:
+    - objetivos: arreglo de n x 2 (ambos se minimizan)
+    Retorna:
+    - Tupla (frentes, rangos, distancias)
+"""
+def rangosYHacinamiento(objetivos):
+    frentes = ordenamientoNoDominado(objetivos)
+    rangos = np.empty(len(objetivos), dtype=int)
+    distancias = np.empty(len(objetivos))
+    for rango, frente in enumerate(frentes):
+        rangos[frente] = rango
+        distancias[frente] = distanciaHacinamiento(objetivos[frente])
+    return frentes, rangos, distancias
+
+
+"""
+    Torneo binario vectorizado: cada ganador es el mejor de dos individuos elegidos al azar (con reemplazo).
+    Es el mismo torneo que seleccion.torneo del Laboratorio 5 con tamaño=2 (consume los mismos números
+    aleatorios), copiado porque las carpetas de los laboratorios tienen espacios en el nombre y no se
+    pueden importar como paquetes sin modificar sys.path
+    Parámetros:
+    - aptitudes: aptitud de cada individuo (mayor es mejor)
+    - n: número de ganadores
+    - generador: np.random.Generator
+    Retorna:
+    - Arreglo con los índices de los ganadores
+"""
+def torneoBinario(aptitudes, n, generador):
+    participantes = generador.integers(0, len(aptitudes), size=(n, 2))
+    return participantes[np.arange(n), np.argmax(aptitudes[participantes], axis=1)]
+
+
+class NSGA2Rutas:
+
+    """
+        Inicializa el algoritmo
+        Parámetros:
+        - grafo: GrafoRutas
+        - origen, destino: etiquetas de los nodos origen y destino
+        - tamaño: tamaño de la población
+        - tasaCruce: probabilidad de cruzar cada pareja de padres
+        - tasaMutacion: probabilidad de mutar cada gen
+        - sigma: escala de las llaves en los pesos de los enlaces
+        - paciencia: generaciones seguidas sin que crezca el hipervolumen antes de detener (None para no detener)
+        - tolerancia: crecimiento relativo mínimo del hipervolumen para no contar la generación como estancada
+    """
+    def __init__(self, grafo, origen, destino, tamaño=100, tasaCruce=0.9, tasaMutacion=0.05, sigma=0.5, paciencia=None, tolerancia=0.0):
+        self.grafo = grafo
+        self.origen = grafo.indices[origen]
+        self.destino = grafo.indices[destino]
+        self.tamaño = tamaño - tamaño % 2
+        self.tasaCruce = tasaCruce
+        self.tasaMutacion = tasaMutacion
+        self.sigma = sigma
+        self.paciencia = paciencia
+        self.tolerancia = tolerancia
+        self.evaluaciones = 0
+        self.generaciones = 0
+        self.archivo = None
+        self.mejorVolumen = 0.0
+        self.estancadas = 0
+
+    """
+        Decodifica y evalúa una población de genomas
+        Parámetros:
+        - genomas: arreglo de P x (1 + número de nodos)
+        Retorna:
+        - Tupla (objetivos de P x 2, lista de caminos)
+    """
+    def evaluar(self, genomas):
+        pesos = self.grafo.pesos(genomas[:, 0], np.exp(self.sigma * genomas[:, 1:]))
+        objetivos = np.empty((len(genomas), 2))
+        caminos = []
+        for k in range(len(genomas)):
+            resultado = self.grafo.caminoMasCorto(self.origen, self.destino, pesos[k].tolist())
+            if resultado is None:
+                raise ValueError("El destino no es alcanzable desde el origen")
+            camino, saltos, costo = resultado
+            objetivos[k] = saltos, costo
+            caminos.append(camino)
+            self.archivo.agregar((saltos, costo), self.grafo.etiquetas(camino))
+        self.evaluaciones += len(genomas)
+        return objetivos, caminos
+
+    """
+        Crea los hijos de una generación: padres por torneo binario sobre (rango, hacinamiento), cruce
+        uniforme por parejas y mutación gaussiana, todo vectorizado
+        Parámetros:
+        - genomas: población actual
+        - rangos, distancias: rango y distancia de hacinamiento de cada individuo
+        - generador: np.random.Generator
+        Retorna:
+        - Arreglo con los genomas de los hijos
+    """
+    def hijos(self, genomas, rangos, distancias, generador):
+        # Menor rango primero y, a igual rango, mayor distancia (1 / (1 + d) queda entre 0 y 1)
+        aptitudes = -rangos - 1 / (1 + distancias)
+        padres = genomas[torneoBinario(aptitudes, self.tamaño, generador)]
+        padres1, padres2 = padres[0::2], padres[1::2]
+        mascara = generador.random(padres1.shape) < 0.5
+        mascara &= (generador.random(len(padres1)) < self.tasaCruce)[:, None]
+        hijos = np.concatenate((np.where(mascara, padres2, padres1), np.where(mascara, padres1, padres2)))
+        mutados = generador.random(hijos.shape) < self.tasaMutacion
+        hijos[mutados] += generador.normal(0, 1, size=int(mutados.sum()))
+        hijos[:, 0] = np.clip(hijos[:, 0], 0, 1)
+        return hijos
+
+    """
+        Registra el hipervolumen del archivo al terminar una generación
+        Retorna:
+        - True si el hipervolumen lleva paciencia generaciones sin crecer más que la tolerancia
+    """
+    def estancado(self):
+        volumen = self.archivo.hipervolumen()
+        if volumen > self.mejorVolumen * (1 + self.tolerancia):
+            self.mejorVolumen = volumen
+            self.estancadas = 0
+        else:
+            self.estancadas += 1
+        return self.paciencia is not None and self.estancadas >= self.paciencia
+
+    """
+        Ejecuta NSGA-II
+        Parámetros:
+        - generaciones: máximo de generaciones
+        - referencia: punto de referencia (saltos, costo) del hipervolumen; por defecto se toma de la población inicial
+        Retorna:
+        - ArchivoPareto con todos los puntos no dominados encontrados y sus caminos
+    """
+    def ejecutar(self, generaciones=100, referencia=None):
+        # El generador sale del módulo random, por lo que random.seed determina toda la ejecución
+        generador = np.random.default_rng(random.getrandbits(64))
+        genomas = np.column_stack((generador.random(self.tamaño), generador.normal(0, 1, (self.tamaño, len(self.grafo)))))
+        self.archivo = ArchivoPareto(sentidos=('min', 'min'), referencia=referencia)
+        objetivos, _ = self.evaluar(genomas)
+        if referencia is None:
+            self.archivo.fijarReferencia(objetivos.max(axis=0) + 1)
+        self.mejorVolumen, self.estancadas = self.archivo.hipervolumen(), 0
+        _, rangos, distancias = rangosYHacinamiento(objetivos)
+
+        for self.generaciones in range(1, generaciones + 1):
+            hijos = self.hijos(genomas, rangos, distancias, generador)
+            objetivosHijos, _ = self.evaluar(hijos)
+
+            # Selección de sobrevivientes entre padres e hijos: frentes completos y el último por hacinamiento
+            genomas = np.concatenate((genomas, hijos))
+            objetivos = np.concatenate((objetivos, objetivosHijos))
+            frentes, rangos, distancias = rangosYHacinamiento(objetivos)
+            elegidos = []
+            for frente in frentes:
+                if len(elegidos) + len(frente) > self.tamaño:
+                    frente = sorted(frente, key=lambda i: -distancias[i])[:self.tamaño - len(elegidos)]
+                elegidos += frente
+                if len(elegidos) == self.tamaño:
+                    break
+            genomas, objetivos = genomas[elegidos], objetivos[elegidos]
+            rangos, distancias = rangos[elegidos], distancias[elegidos]
+
+            if self.estancado():
+                break
+        return self.archivo
+
+
+"""
+    Frontera exacta con el método epsilon-constraint de punto 1.1.py sobre los enlaces del grafo:
+    minimizar el costo con saltos <= epsilon, bajando epsilon hasta que el problema sea infactible
+    Parámetros:
+    - grafo: GrafoRutas
+    - origen, destino: etiquetas de los nodos origen y destino
+    - solver: nombre del solver de Pyomo (el mismo que usa el resto del laboratorio, por ejemplo 'glpk')
+    - paso: diferencia mínima de saltos entre dos puntos de la frontera
+    Retorna:
+    - ArchivoPareto con los puntos de la frontera y sus caminos
+"""
+def fronteraEpsilon(grafo, origen, destino, solver, paso=1):
+    from pyomo.environ import (ConcreteModel, Set, Var, Binary, Param, Expression, Objective, Constraint,
+                               minimize, value)
+    from pyomo.opt import SolverFactory, TerminationCondition
+
+    Model = ConcreteModel()
+    Model.N = Set(initialize=grafo.nodos)
+    Model.E = Set(initialize=[(i, j) for i, j, _, _ in grafo.aristas], dimen=2)
+    saltos = {(i, j): h for i, j, h, _ in grafo.aristas}
+    costos = {(i, j): c for i, j, _, c in grafo.aristas}
+    Model.x = Var(Model.E, domain=Binary)
+    Model.f1 = Expression(expr=sum(Model.x[i, j] * saltos[i, j] for i, j in Model.E))
+    Model.f2 = Expression(expr=sum(Model.x[i, j] * costos[i, j] for i, j in Model.E))
+    Model.O_z = Objective(expr=Model.f2, sense=minimize)
+
+    # Conservación de flujo: sale un camino del origen y llega al destino
+    salientes = {n: [] for n in grafo.nodos}
+    entrantes = {n: [] for n in grafo.nodos}
+    for i, j in Model.E:
+        salientes[i].append((i, j))
+        entrantes[j].append((i, j))
+
+    def flujo_rule(Model, n):
+        balance = 1 if n == origen else (-1 if n == destino else 0)
+        return sum(Model.x[e] for e in salientes[n]) - sum(Model.x[e] for e in entrantes[n]) == balance
+
+    Model.flujo = Constraint(Model.N, rule=flujo_rule)
+    Model.epsilon = Param(mutable=True, initialize=sum(saltos.values()))
+    Model.hops = Constraint(expr=Model.f1 <= Model.epsilon)
+
+    archivo = ArchivoPareto(sentidos=('min', 'min'))
+    opt = SolverFactory(solver)
+    while True:
+        resultados = opt.solve(Model, load_solutions=False)
+        if resultados.solver.termination_condition != TerminationCondition.optimal:
+            break
+        Model.solutions.load_from(resultados)
+        # Se sigue el camino desde el origen por los enlaces elegidos
+        siguiente = {i: j for i, j in Model.E if value(Model.x[i, j]) > 0.5}
+        camino = [origen]
+        while camino[-1] != destino:
+            camino.append(siguiente[camino[-1]])
+        valorF1 = value(Model.f1)
+        archivo.agregar((valorF1, value(Model.f2)), tuple(camino))
+        Model.epsilon = valorF1 - paso
+    return archivo
+
+
+"""
+    Compara la frontera de NSGA-II con la frontera exacta de epsilon-constraint
+    Parámetros:
+    - grafo, origen, destino: instancia
+    - exacto: ArchivoPareto de fronteraEpsilon
+    - semillas: semillas de las ejecuciones de NSGA-II
+    - opciones: parámetros de NSGA2Rutas y de ejecutar (tamaño, generaciones, ...)
+    Retorna:
+    - Lista de diccionarios con la cobertura, el hipervolumen relativo, el tiempo y las evaluaciones de cada semilla
+"""
+def compararConExacta(grafo, origen, destino, exacto, semillas=range(5), generaciones=100, **opciones):
+    referencia = exacto.objetivos().max(axis=0) + 1
+    volumenExacto = ArchivoPareto(referencia=referencia)
+    volumenExacto.agregarTodos(exacto.objetivos())
+    resultados = []
+    for semilla in semillas:
+        random.seed(semilla)
+        algoritmo = NSGA2Rutas(grafo, origen, destino, **opciones)
+        inicio = time.perf_counter()
+        aproximado = algoritmo.ejecutar(generaciones, referencia=referencia)
+        resultados.append({
+            'semilla': semilla, 'puntosExactos': len(exacto), 'puntosNSGA2': len(aproximado),
+            # Fracción de la frontera exacta que NSGA-II encontró, y de NSGA-II que es exacta
+            'coberturaExacta': cobertura(aproximado, exacto, 1e-9), 'coberturaNSGA2': cobertura(exacto, aproximado, 1e-9),
+            'hipervolumenRelativo': aproximado.hipervolumen() / volumenExacto.hipervolumen(),
+            'tiempo': time.perf_counter() - inicio, 'evaluaciones': algoritmo.evaluaciones
+        })
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NSGA-II contra epsilon-constraint en el problema de rutas")
+    parser.add_argument('--solver', default='glpk', help="Solver de Pyomo para la frontera exacta")
+    argumentos = parser.parse_args()
+
+    # Instancias pequeñas: frontera exacta contra NSGA-II
+    for n in [50, 200]:
+        grafo, origen, destino = grafoAleatorio(n, vecinos=4, semilla=n)
+        inicio = time.perf_counter()
+        exacto = fronteraEpsilon(grafo, origen, destino, argumentos.solver)
+        print(f'n = {n}: {len(exacto)} puntos exactos en {time.perf_counter() - inicio:.2f} s con epsilon-constraint')
+        for fila in compararConExacta(grafo, origen, destino, exacto, tamaño=60, generaciones=60):
+            print(f"  semilla {fila['semilla']}: cubre {fila['coberturaExacta']:.0%} de la frontera exacta, "
+                  f"{fila['coberturaNSGA2']:.0%} de sus puntos son exactos, hipervolumen {fila['hipervolumenRelativo']:.3f}, "
+                  f"{fila['tiempo']:.2f} s")
+
+    # Instancias grandes: una sola ejecución con parada por estancamiento del hipervolumen
+    for n in [1000, 5000]:
+        grafo, origen, destino = grafoAleatorio(n, semilla=n)
+        random.seed(0)
+        algoritmo = NSGA2Rutas(grafo, origen, destino, tamaño=60, paciencia=15)
+        inicio = time.perf_counter()
+        archivo = algoritmo.ejecutar(generaciones=100)
+        print(f'n = {n}: {len(archivo)} puntos no dominados en {algoritmo.generaciones} generaciones, '
+              f'{time.perf_counter() - inicio:.1f} s ({algoritmo.evaluaciones} evaluaciones)')
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,12 @@ import matplotlib.pyplot as plt
 from pyomo.environ import *
 from pyomo.opt import SolverFactory
 
+# Archivo de Pareto (filtra duplicados, dominados y penalizaciones)
+from archivoPareto import ArchivoPareto, cobertura
+
+# NSGA-II sobre las mismas matrices de saltos y costos
+from nsga2Rutas import GrafoRutas, NSGA2Rutas, aristasDesdeMatrices
+
 ##############################################################################
 #####################        FUNCIONES        ################################
 ##############################################################################
@@ -103,6 +109,10 @@ Model.f2 = sum(Model.x[i,j] * Model.c[i,j] for i in Model.N for j in Model.N)
 f1_vec=[]
 f2_vec=[]
 
+# Referencia del hipervolumen: más saltos que cualquier camino simple y la suma de los costos finitos
+costoMaximo = sum(value(Model.c[i,j]) for i in Model.N for j in Model.N if value(Model.c[i,j]) < 999)
+archivo = ArchivoPareto(sentidos=('min', 'min'), referencia=(numNodes, costoMaximo), penalizacion=999)
+
 for epsilon in epsilons:
     # Función objetivo general
     Model.O_z = Objective(expr= Model.f2, sense=minimize)
@@ -144,6 +154,9 @@ for epsilon in epsilons:
     valorF2 = value(Model.f2)
     f1_vec.append(valorF1)
     f2_vec.append(valorF2)
+    # Los enlaces elegidos son el vector de decisión del punto
+    enlaces = [(i,j) for i in Model.N for j in Model.N if value(Model.x[i,j]) > 0.5]
+    archivo.agregar((valorF1, valorF2), enlaces)
 
     # Borrado de componentes
     delete_component(Model, 'O_z')
@@ -154,8 +167,25 @@ for epsilon in epsilons:
     delete_component(Model, 'hops')
     # Termina el ciclo
 
+# Frente de Pareto sin duplicados, dominados ni penalizaciones ----------------
+for (saltos, costo), enlaces in archivo.puntos():
+    print(f'Saltos: {saltos:.0f}, Costo: {costo:.0f}, Enlaces: {enlaces}')
+print(archivo.resumen())
+
+# Frente aproximado con NSGA-II (una sola ejecución) --------------------------
+h = {(i,j): value(Model.h[i,j]) for i in Model.N for j in Model.N}
+c = {(i,j): value(Model.c[i,j]) for i in Model.N for j in Model.N}
+grafo = GrafoRutas(aristasDesdeMatrices(h, c))
+aproximado = NSGA2Rutas(grafo, s, d, tamaño=20).ejecutar(generaciones=20, referencia=(numNodes, costoMaximo))
+print(f'NSGA-II: {len(aproximado)} puntos, cubre {cobertura(aproximado, archivo):.0%} del frente exacto, '
+      f'hipervolumen {aproximado.hipervolumen()} de {archivo.hipervolumen()}')
+
 # Gráfica Pareto  ------------------------------------------------------------
-plt.plot(f1_vec, f2_vec, 'o-.')
+frente = archivo.objetivos()
+plt.plot(frente[:, 0], frente[:, 1], 'o-.', label='Epsilon-constraint')
+frenteAproximado = aproximado.objetivos()
+plt.plot(frenteAproximado[:, 0], frenteAproximado[:, 1], 'x', label='NSGA-II')
+plt.legend()
 plt.title('Frente óptimo de Pareto')
 plt.xlabel('F1')
 plt.ylabel('F2')
@@ -0,0 +1,193 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Control de convergencia para los algoritmos genéticos. En lugar de ejecutar
+siempre el máximo de generaciones con una tasa de mutación fija, el control
+sigue en cada generación la mejor aptitud, la aptitud promedio y la diversidad
+de la población:
+- Si ni la mejor aptitud ni el mejor promedio visto mejoran durante K generaciones
+  seguidas (meseta), la ejecución se detiene.
+- Si la diversidad cae por debajo de una fracción de la diversidad de la primera
+  generación (la población colapsó en unos pocos genomas), la tasa de mutación se
+  multiplica para volver a explorar, y regresa gradualmente a la tasa base cuando la
+  diversidad se recupera. Al ser relativa, la misma fracción sirve para cualquier
+  medida de diversidad (genomas del laberinto o desviación de los colores).
+
+La tasa base es la del solver: al conectar el control, el solver la fija con
+iniciarTasa en la primera generación, salvo que se haya indicado otra al crearlo.
+
+Se debe usar un control nuevo por ejecución.
+
+"""
+
+import random
+import time
+
+import numpy as np
+
+from laberinto import crearLaberinto
+
+
+"""
+    Calcula la diversidad de una población del laberinto: para cada posición del genoma, la fracción de
+    individuos cuyo gen es distinto del gen más común, promediada sobre el genoma. En los genomas de
+    tuplas (dirección, pasos) dos genes son iguales solo si coinciden la dirección y los pasos
+
+    Parametros:
+    poblacion: Lista de individuos (listas de direcciones o de tuplas (dirección, pasos))
+
+    Retorna:
+    Diversidad entre 0 (todos los individuos tienen los mismos genes) y 1
+"""
+def diversidadGenomas(poblacion):
+    genomas = np.asarray(poblacion, dtype=np.int64)
+    if genomas.ndim == 3:
+        genomas = genomas[..., 0] * (genomas[..., 1].max() + 1) + genomas[..., 1]
+    # Frecuencia del gen más común de cada columna: la racha más larga de valores iguales tras ordenar
+    ordenados = np.sort(genomas, axis=0)
+    filas = np.arange(len(ordenados))[:, None]
+    nuevos = np.ones(ordenados.shape, dtype=bool)
+    nuevos[1:] = ordenados[1:] != ordenados[:-1]
+    rachas = filas - np.maximum.accumulate(np.where(nuevos, filas, 0), axis=0) + 1
+    return float(1 - rachas.max(axis=0).mean() / len(ordenados))
+
+
+class ControlConvergencia:
+    """
+    Detiene la evolución en una meseta y adapta la tasa de mutación según la diversidad
+    """
+
+    """
+    Inicializa el control
+
+    Parametros:
+    paciencia: Generaciones seguidas sin mejora (K) antes de detener
+    tasaMutacion: Tasa de mutación base (por defecto la del solver, ver iniciarTasa)
+    diversidadMinima: Fracción de la diversidad inicial por debajo de la cual se aumenta la mutación
+    factor: Factor por el que se multiplica (o divide) la tasa de mutación en cada generación
+    tasaMaxima: Tasa de mutación máxima
+    tolerancia: Mejora mínima (absoluta) de la mejor aptitud o del promedio para no contar la generación como estancada
+    """
+    def __init__(self, paciencia=25, tasaMutacion=None, diversidadMinima=0.5, factor=1.5, tasaMaxima=0.5, tolerancia=0.0):
+        self.paciencia = paciencia
+        self.tasaBase = tasaMutacion
+        self.tasaMutacion = tasaMutacion
+        self.diversidadMinima = diversidadMinima
+        self.factor = factor
+        self.tasaMaxima = tasaMaxima
+        self.tolerancia = tolerancia
+        self.mejor = -np.inf
+        self.promedio = -np.inf
+        self.diversidadInicial = None
+        self.estancadas = 0
+        self.generaciones = 0
+        self.ajustes = 0
+
+    """
+    Fija la tasa base con la tasa de mutación del solver si no se indicó al crear el control. El solver la
+    llama antes de cada actualizar; solo tiene efecto la primera vez
+    """
+    def iniciarTasa(self, tasaMutacion):
+        if self.tasaBase is None:
+            self.tasaBase = self.tasaMutacion = tasaMutacion
+
+    """
+    Retorna True si la evolución lleva K generaciones sin mejorar
+    """
+    def detenido(self):
+        return self.estancadas >= self.paciencia
+
+    """
+    Registra una generación
+
+    Parametros:
+    mejor: Mejor aptitud de la generación
+    promedio: Aptitud promedio de la generación
+    diversidad: Diversidad de la población
+
+    Retorna:
+    True si la evolución se debe detener
+    """
+    def actualizar(self, mejor, promedio, diversidad):
+        mejoraMejor = mejor > self.mejor + self.tolerancia
+        mejoraPromedio = promedio > self.promedio + self.tolerancia
+        if mejoraMejor:
+            self.mejor = mejor
+        if mejoraPromedio:
+            self.promedio = promedio
+        self.estancadas = 0 if mejoraMejor or mejoraPromedio else self.estancadas + 1
+
+        if self.diversidadInicial is None:
+            self.diversidadInicial = diversidad
+        if diversidad < self.diversidadMinima * self.diversidadInicial:
+            self.tasaMutacion = min(self.tasaMutacion * self.factor, self.tasaMaxima)
+            self.ajustes += 1
+        else:
+            self.tasaMutacion = max(self.tasaMutacion / self.factor, self.tasaBase)
+        self.generaciones += 1
+        return self.detenido()
+
+    """
+    Retorna el estado del control como arreglos para guardarlo en un punto de control
+    """
+    def estado(self):
+        return {'controlMejor': np.array(self.mejor), 'controlPromedio': np.array(self.promedio),
+                'controlDiversidadInicial': np.array(np.nan if self.diversidadInicial is None else self.diversidadInicial),
+                'controlEstancadas': np.array(self.estancadas), 'controlGeneraciones': np.array(self.generaciones),
+                'controlAjustes': np.array(self.ajustes), 'controlTasaMutacion': np.array(self.tasaMutacion),
+                'controlTasaBase': np.array(np.nan if self.tasaBase is None else self.tasaBase)}
+
+    """
+    Restaura el estado guardado con estado()
+    """
+    def restaurar(self, estado):
+        self.mejor = float(estado['controlMejor'])
+        self.promedio = float(estado['controlPromedio'])
+        diversidadInicial = float(estado['controlDiversidadInicial'])
+        self.diversidadInicial = None if np.isnan(diversidadInicial) else diversidadInicial
+        self.estancadas = int(estado['controlEstancadas'])
+        self.generaciones = int(estado['controlGeneraciones'])
+        self.ajustes = int(estado['controlAjustes'])
+        tasaBase = float(estado['controlTasaBase'])
+        self.tasaBase = None if np.isnan(tasaBase) else tasaBase
+        self.tasaMutacion = None if self.tasaBase is None else float(estado['controlTasaMutacion'])
+
+
+"""
+    Compara la evolución con y sin control de convergencia sobre varias semillas. El laberinto se genera con
+    su propia semilla (create_maze usa random.shuffle sin semilla y cambiaría en cada ejecución del notebook)
+
+    Parametros:
+    crearSolver: Función sin argumentos que crea un solver (por ejemplo GeneticMazeSolver)
+    crearControl: Función sin argumentos que crea un ControlConvergencia
+    dim: Número de celdas por lado del laberinto
+    start: Punto de inicio
+    end: Punto final
+    genome_length: Longitud del genoma
+    drawer: Dibujante que no dibuja (para medir solo la evolución)
+    tamaño: Tamaño de la población
+    generaciones: Máximo de generaciones
+    semillas: Semillas de las ejecuciones
+    semillaLaberinto: Semilla del laberinto (crearLaberinto con el algoritmo DFS de create_maze)
+
+    Retorna:
+    Lista de diccionarios con las generaciones, evaluaciones, tiempo y mejor recompensa de cada ejecución
+"""
+def compararConvergencia(crearSolver, crearControl, dim, start, end, genome_length, drawer, tamaño=50, generaciones=100, semillas=range(5), semillaLaberinto=2):
+    maze = crearLaberinto(dim, semillaLaberinto)
+    resultados = []
+    for semilla in semillas:
+        for nombre, control in [('fijo', None), ('control', crearControl())]:
+            random.seed(semilla)
+            solver = crearSolver()
+            poblacion = solver.generate_population(tamaño, genome_length)
+            inicio = time.perf_counter()
+            _, mejor = solver.evolve(poblacion, maze, start, end, generaciones, drawer, control=control)
+            resultados.append({
+                'semilla': semilla, 'ejecucion': nombre, 'mejor': mejor,
+                'generaciones': control.generaciones if control is not None else generaciones,
+                'evaluaciones': solver.evaluaciones, 'tiempo': time.perf_counter() - inicio
+            })
+    return resultados
@@ -0,0 +1,266 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Evaluación vectorizada de la recompensa de toda una población del laberinto.
+En lugar de recorrer cada genoma movimiento a movimiento, se simulan los P
+individuos al mismo tiempo: las posiciones son arreglos de tamaño P, las paredes
+se consultan en una máscara con un borde de paredes (sin revisar límites) y las
+celdas visitadas se guardan con un bit por celda e individuo (CeldasVisitadas), solo
+en el rectángulo que la población puede alcanzar desde el inicio.
+
+Ambas funciones reproducen exactamente la función reward de los cuadernos:
+- recompensasPasoSimple: genoma de un paso por gen (solucionP2.ipynb)
+- recompensasPorTramos: genoma de tuplas (dirección, pasos) (solucionP3.ipynb)
+
+Con un AnalisisLaberinto (preprocesamiento.py) se usa en cambio la distancia real
+(BFS) hasta la salida, y recompensasAnalizadas avanza cada gen (dirección, pasos) en
+O(1) con la tabla de saltos hasta la pared.
+
+"""
+
+import numpy as np
+
+# Direcciones de los genes: derecha, izquierda, arriba, abajo
+DX = np.array([0, 0, -1, 1])
+DY = np.array([1, -1, 0, 0])
+
+
+class CeldasVisitadas:
+    """
+    Celdas visitadas por cada individuo, empaquetadas en un bit por celda. Solo se reserva el rectángulo de
+    celdas a distancia menor o igual al alcance desde el inicio, por lo que la memoria es P x min(celdas, (2 alcance + 1)^2) / 8 bytes
+    """
+
+    """
+    Inicializa las celdas visitadas
+
+    Parametros:
+    tamaño: Número de individuos
+    forma: Forma (alto, ancho) de la cuadrícula
+    inicio: Celda de inicio (x, y)
+    alcance: Máximo de movimientos de un individuo en cada eje
+    """
+    def __init__(self, tamaño, forma, inicio, alcance):
+        self.x0, self.y0 = max(inicio[0] - alcance, 0), max(inicio[1] - alcance, 0)
+        alto = min(inicio[0] + alcance, forma[0] - 1) - self.x0 + 1
+        self.ancho = min(inicio[1] + alcance, forma[1] - 1) - self.y0 + 1
+        self.bits = np.zeros((tamaño, (alto * self.ancho + 7) // 8), dtype=np.uint8)
+
+    """
+    Retorna el byte y la máscara del bit de cada celda
+    """
+    def posiciones(self, x, y):
+        celdas = (np.asarray(x) - self.x0) * self.ancho + (np.asarray(y) - self.y0)
+        return celdas >> 3, np.left_shift(1, celdas & 7).astype(np.uint8)
+
+    """
+    Indica para cada individuo de filas si ya visitó la celda (x, y) correspondiente
+    """
+    def contiene(self, filas, x, y):
+        byte, mascara = self.posiciones(x, y)
+        return (self.bits[filas, byte] & mascara) != 0
+
+    """
+    Marca la celda (x, y) como visitada para cada individuo de filas (cada individuo aparece una sola vez)
+    """
+    def marcar(self, filas, x, y):
+        byte, mascara = self.posiciones(x, y)
+        self.bits[filas, byte] |= mascara
+
+
+"""
+    Calcula la recompensa final restando la distancia euclidiana al punto final.
+    Se hace con aritmética de Python para que el resultado sea idéntico al de reward.
+    Si se entrega el análisis del laberinto se resta la distancia BFS real
+
+    Parametros:
+    recompensas: Arreglo de recompensas enteras
+    x, y: Posiciones finales (con el desplazamiento del borde)
+    end: Punto final
+    analisis: AnalisisLaberinto (opcional)
+
+    Retorna:
+    Lista de recompensas
+"""
+def restarDistancia(recompensas, x, y, end, analisis=None):
+    if analisis is not None:
+        return [float(total) for total in (recompensas - analisis.distancias[x, y]).tolist()]
+    return [total - ((int(px) - 1 - end[0])**2 + (int(py) - 1 - end[1])**2)**0.5
+            for total, px, py in zip(recompensas.tolist(), x, y)]
+
+
+"""
+    Calcula la recompensa de todos los individuos con genoma de un paso por gen
+
+    Parametros:
+    poblacion: Lista de individuos (listas de direcciones entre 0 y 3) de igual longitud
+    maze: Laberinto
+    start: Punto de inicio
+    end: Punto final
+    analisis: AnalisisLaberinto para usar la distancia BFS en lugar de la euclidiana (opcional)
+
+    Retorna:
+    Lista de recompensas, en el mismo orden de la población
+"""
+def recompensasPasoSimple(poblacion, maze, start, end, analisis=None):
+    genomas = np.asarray(poblacion, dtype=np.int64).reshape(len(poblacion), -1)
+    tamaño, longitud = genomas.shape
+    # Máscara de paredes con un borde de paredes alrededor (fuera del laberinto = pared)
+    paredes = np.pad(np.asarray(maze) == 1, 1, constant_values=True)
+
+    filas = np.arange(tamaño)
+    x = np.full(tamaño, start[0] + 1)
+    y = np.full(tamaño, start[1] + 1)
+    finX, finY = end[0] + 1, end[1] + 1
+    visitadas = CeldasVisitadas(tamaño, paredes.shape, (x[0], y[0]), longitud)
+    recompensas = np.full(tamaño, 500000, dtype=np.int64)
+    activos = np.ones(tamaño, dtype=bool)
+
+    for paso in range(longitud):
+        if not activos.any():
+            break
+        movimientos = genomas[:, paso]
+        nx, ny = x + DX[movimientos], y + DY[movimientos]
+        bloqueado = paredes[nx, ny]
+        recompensas[activos & bloqueado] -= 1000
+
+        avanza = activos & ~bloqueado
+        x = np.where(avanza, nx, x)
+        y = np.where(avanza, ny, y)
+        nueva = avanza & ~visitadas.contiene(filas, x, y)
+        visitadas.marcar(filas[nueva], x[nueva], y[nueva])
+        recompensas[nueva] += 100000
+
+        llega = avanza & (x == finX) & (y == finY)
+        recompensas[llega] += 5000000000000
+        activos &= ~llega
+
+    return restarDistancia(recompensas, x, y, end, analisis)
+
+
+"""
+    Calcula la recompensa de todos los individuos con genoma de tuplas (dirección, pasos)
+
+    Parametros:
+    poblacion: Lista de individuos (listas de tuplas (dirección, pasos)) de igual longitud
+    maze: Laberinto
+    start: Punto de inicio
+    end: Punto final
+
+    Retorna:
+    Lista de recompensas, en el mismo orden de la población
+"""
+def recompensasPorTramos(poblacion, maze, start, end):
+    genomas = np.asarray(poblacion, dtype=np.int64).reshape(len(poblacion), -1, 2)
+    tamaño, longitud, _ = genomas.shape
+    # Máscara de celdas libres con un borde de paredes alrededor
+    libres = np.pad(np.asarray(maze) == 0, 1, constant_values=False)
+
+    # Tramo inicial hacia la derecha, común a todos los individuos
+    x0, y0 = start[0] + 1, start[1] + 1
+    inicioY = y0
+    base = 50000000
+    while libres[x0, y0 + 1]:
+        y0 += 1
+        base += 100000
+
+    filas = np.arange(tamaño)
+    x = np.full(tamaño, x0)
+    y = np.full(tamaño, y0)
+    finX, finY = end[0] + 1, end[1] + 1
+    alcance = y0 - inicioY + int(np.clip(genomas[:, :, 1], 0, None).sum(axis=1).max(initial=0))
+    visitadas = CeldasVisitadas(tamaño, libres.shape, (x0, inicioY), alcance)
+    for celdaY in range(inicioY, y0 + 1):
+        visitadas.marcar(filas, x, np.full(tamaño, celdaY))
+    recompensas = np.full(tamaño, base, dtype=np.int64)
+    activos = np.ones(tamaño, dtype=bool)
+
+    for gen in range(longitud):
+        if not activos.any():
+            break
+        dx, dy = DX[genomas[:, gen, 0]], DY[genomas[:, gen, 0]]
+        pasos = genomas[:, gen, 1].copy()
+
+        libre = libres[x + dx, y + dy]
+        recompensas[activos & ~libre] -= 1000
+        procesa = activos & libre
+
+        # Avanza a todos los individuos en su dirección hasta agotar los pasos o chocar
+        moviendo = procesa & (pasos > 0)
+        while moviendo.any():
+            x = np.where(moviendo, x + dx, x)
+            y = np.where(moviendo, y + dy, y)
+            pasos -= moviendo
+            indices = filas[moviendo]
+            repetida = visitadas.contiene(indices, x[moviendo], y[moviendo])
+            recompensas[indices[~repetida]] += 100000
+            recompensas[indices[repetida]] -= 100
+            visitadas.marcar(indices, x[moviendo], y[moviendo])
+            moviendo &= (pasos > 0) & libres[x + dx, y + dy]
+
+        recompensas[procesa] -= 10 * pasos[procesa]
+        llega = procesa & (x == finX) & (y == finY)
+        recompensas[llega] += 50000000000
+        activos &= ~llega
+
+    return restarDistancia(recompensas, x, y, end)
+
+
+"""
+    Calcula una recompensa aproximada de los individuos con genoma de tuplas (dirección, pasos)
+    en O(1) por gen, usando el laberinto preprocesado. Cada gen avanza min(pasos, salto hasta la pared)
+    celdas de una vez. Como no se recorren las celdas intermedias, la bonificación por celdas nuevas se
+    decide por la celda de llegada del tramo, y se resta la distancia BFS real en lugar de la euclidiana
+
+    Parametros:
+    poblacion: Lista de individuos (listas de tuplas (dirección, pasos)) de igual longitud
+    analisis: AnalisisLaberinto del laberinto, con el inicio y el final
+
+    Retorna:
+    Lista de recompensas, en el mismo orden de la población
+"""
+def recompensasAnalizadas(poblacion, analisis):
+    genomas = np.asarray(poblacion, dtype=np.int64).reshape(len(poblacion), -1, 2)
+    tamaño, longitud, _ = genomas.shape
+    saltos = analisis.saltos
+
+    # Tramo inicial hacia la derecha, común a todos los individuos
+    x0, y0 = analisis.inicio
+    tramoInicial = int(saltos[0, x0, y0])
+    filas = np.arange(tamaño)
+    x = np.full(tamaño, x0)
+    y = np.full(tamaño, y0 + tramoInicial)
+    finX, finY = analisis.fin
+    alcance = tramoInicial + int(np.clip(genomas[:, :, 1], 0, None).sum(axis=1).max(initial=0))
+    visitadas = CeldasVisitadas(tamaño, analisis.libres.shape, (x0, y0), alcance)
+    visitadas.marcar(filas, np.full(tamaño, x0), np.full(tamaño, y0))
+    visitadas.marcar(filas, x, y)
+    recompensas = np.full(tamaño, 50000000 + 100000 * tramoInicial, dtype=np.int64)
+    activos = np.ones(tamaño, dtype=bool)
+
+    for gen in range(longitud):
+        if not activos.any():
+            break
+        direcciones = genomas[:, gen, 0]
+        pasos = genomas[:, gen, 1]
+        salto = saltos[direcciones, x, y]
+        recompensas[activos & (salto == 0)] -= 1000
+        procesa = activos & (salto > 0)
+
+        avance = np.where(procesa, np.clip(np.minimum(pasos, salto), 0, None), 0)
+        x = x + DX[direcciones] * avance
+        y = y + DY[direcciones] * avance
+        mueve = avance > 0
+        nueva = mueve & ~visitadas.contiene(filas, x, y)
+        visitadas.marcar(filas[mueve], x[mueve], y[mueve])
+        recompensas[nueva] += 100000 * avance[nueva]
+        recompensas[mueve & ~nueva] -= 100 * avance[mueve & ~nueva]
+
+        recompensas[procesa] -= 10 * (pasos - avance)[procesa]
+        llega = procesa & (x == finX) & (y == finY)
+        recompensas[llega] += 50000000000
+        activos &= ~llega
+
+    return restarDistancia(recompensas, x, y, None, analisis)
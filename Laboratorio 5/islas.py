@@ -0,0 +1,264 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Modelo de islas para el algoritmo genético del laberinto. Se evolucionan K
+subpoblaciones en un grupo de procesos y cada M generaciones (una época) los
+mejores individuos de cada isla migran a otra isla según una topología de anillo
+o aleatoria, reemplazando a los peores individuos de la isla destino.
+
+Cada isla tiene su propio estado del generador aleatorio, derivado de una semilla,
+que viaja con la isla entre épocas. Así los resultados son deterministas sin
+importar qué proceso ejecute cada isla. El estado del generador global del
+llamador se restaura al terminar. Las islas, la migración y la población única de
+referencia usan semillas derivadas distintas, por lo que ninguna comparte su
+secuencia aleatoria con otra.
+
+Cada isla revisa en todas las generaciones si ya encontró una solución y guarda el
+instante en que la encontró, así el tiempo hasta la primera solución no depende de
+la duración de las épocas.
+
+Cada proceso trabajador crea su solver (con su laberinto preprocesado, si lo tiene)
+una sola vez al iniciar; en cada época solo viajan las poblaciones, las recompensas
+y los estados aleatorios.
+
+El solver debe tener los métodos generate_population, evaluate y next_generation
+(GeneticMazeSolver). Si su clase está definida en el cuaderno, los procesos deben
+crearse con 'fork' (por defecto en Linux) para que la clase exista en los trabajadores.
+
+"""
+
+import multiprocessing
+import random
+import time
+
+# Solver y datos del laberinto de cada proceso trabajador (se crean una sola vez)
+_laberinto = {}
+
+
+"""
+    Deriva de la semilla base la semilla de un flujo aleatorio (una isla, la migración o la
+    población única de referencia). Random acepta cadenas y las convierte en la semilla con un hash
+"""
+def semillaDerivada(semilla, flujo):
+    return f'{semilla}-{flujo}'
+
+
+"""
+    Inicializa un proceso trabajador con su solver, el laberinto, el inicio y el final
+"""
+def inicializarTrabajador(crearSolver, maze, start, end):
+    _laberinto['solver'] = crearSolver()
+    _laberinto['maze'], _laberinto['start'], _laberinto['end'] = maze, start, end
+
+
+"""
+    Evoluciona una isla durante una época, restaurando y guardando su estado aleatorio.
+    La solución se busca en cada generación y se guarda su instante con time.time, porque el
+    origen de time.perf_counter no está definido entre procesos distintos
+
+    Parametros:
+    tarea: Tupla (población, recompensas, estado aleatorio, generaciones, umbral de solución)
+
+    Retorna:
+    Tupla (población, recompensas, estado aleatorio, generación de la primera solución o None,
+    instante de la primera solución o None, evaluaciones)
+"""
+def evolucionarIsla(tarea):
+    poblacion, recompensas, estado, generaciones, umbral = tarea
+    solver, maze, start, end = _laberinto['solver'], _laberinto['maze'], _laberinto['start'], _laberinto['end']
+    random.setstate(estado)
+    solver.evaluaciones = 0
+    generacionSolucion, instanteSolucion = None, None
+    for generacion in range(generaciones):
+        poblacion, recompensas = solver.next_generation(poblacion, recompensas, maze, start, end)
+        if generacionSolucion is None and umbral is not None and max(recompensas) >= umbral:
+            generacionSolucion, instanteSolucion = generacion, time.time()
+    return poblacion, recompensas, random.getstate(), generacionSolucion, instanteSolucion, solver.evaluaciones
+
+
+"""
+    Ejecuta una sola población sin dibujar, como referencia para comparar con el modelo de islas
+
+    Parametros:
+    solver: GeneticMazeSolver
+    population: Población inicial
+    maze: Laberinto
+    start: Punto de inicio
+    end: Punto final
+    generaciones: Número de generaciones
+    umbral: Recompensa a partir de la cual un individuo se considera solución (opcional)
+
+    Retorna:
+    Mejor individuo, su recompensa y un diccionario con el tiempo total y el tiempo hasta la primera solución
+"""
+def ejecutarUnaPoblacion(solver, population, maze, start, end, generaciones, umbral=None):
+    inicio = time.perf_counter()
+    solver.evaluaciones = 0
+    recompensas = solver.evaluate(population, [None] * len(population), maze, start, end)
+    tiempoSolucion = None
+    for _ in range(generaciones):
+        population, recompensas = solver.next_generation(population, recompensas, maze, start, end)
+        if tiempoSolucion is None and umbral is not None and max(recompensas) >= umbral:
+            tiempoSolucion = time.perf_counter() - inicio
+    mejor = max(range(len(population)), key=lambda j: recompensas[j])
+    metricas = {'tiempo': time.perf_counter() - inicio, 'tiempoPrimeraSolucion': tiempoSolucion,
+                'evaluaciones': solver.evaluaciones}
+    return population[mejor], recompensas[mejor], metricas
+
+
+class ModeloIslas:
+    """
+    Algoritmo genético con K islas que evolucionan en paralelo y migran cada M generaciones
+    """
+
+    """
+    Inicializa el modelo de islas
+
+    Parametros:
+    crearSolver: Función sin argumentos que crea un solver (por ejemplo GeneticMazeSolver)
+    islas: Número de subpoblaciones K
+    tamañoIsla: Individuos por isla
+    intervaloMigracion: Generaciones entre migraciones M
+    migrantes: Número de mejores individuos que migran de cada isla
+    topologia: 'anillo' (la isla i envía a la i + 1) o 'aleatoria' (permutación nueva en cada migración)
+    semilla: Semilla base, de la que se derivan semillas distintas para cada isla, la migración y la población única
+    procesos: Número de procesos del grupo (por defecto uno por isla)
+    """
+    def __init__(self, crearSolver, islas=4, tamañoIsla=50, intervaloMigracion=10, migrantes=2,
+                 topologia='anillo', semilla=0, procesos=None):
+        if topologia not in ('anillo', 'aleatoria'):
+            raise ValueError(f"Topología no soportada: {topologia}")
+        self.crearSolver = crearSolver
+        self.islas = islas
+        self.tamañoIsla = tamañoIsla
+        self.intervaloMigracion = intervaloMigracion
+        self.migrantes = migrantes
+        self.topologia = topologia
+        self.semilla = semilla
+        self.procesos = procesos or islas
+        self.metricas = {}
+
+    """
+    Retorna a qué isla envía sus migrantes cada isla
+    """
+    def destinos(self, generadorMigracion):
+        if self.topologia == 'anillo':
+            return [(k + 1) % self.islas for k in range(self.islas)]
+        destinos = list(range(self.islas))
+        generadorMigracion.shuffle(destinos)
+        return destinos
+
+    """
+    Copia los mejores individuos de cada isla a su isla destino, reemplazando a los peores
+    """
+    def migrar(self, poblaciones, recompensas, generadorMigracion):
+        salientes = []
+        for poblacion, recompensa in zip(poblaciones, recompensas):
+            mejores = sorted(range(len(poblacion)), key=lambda j: recompensa[j], reverse=True)[:self.migrantes]
+            salientes.append([(poblacion[j][:], recompensa[j]) for j in mejores])
+        for origen, destino in enumerate(self.destinos(generadorMigracion)):
+            if origen == destino:
+                continue
+            peores = sorted(range(len(poblaciones[destino])), key=lambda j: recompensas[destino][j])
+            for j, (individuo, recompensa) in zip(peores, salientes[origen]):
+                poblaciones[destino][j] = individuo
+                recompensas[destino][j] = recompensa
+
+    """
+    Ejecuta el modelo de islas
+
+    Parametros:
+    maze: Laberinto
+    start: Punto de inicio
+    end: Punto final
+    genome_length: Longitud del genoma
+    generaciones: Número total de generaciones por isla
+    umbral: Recompensa a partir de la cual un individuo se considera solución (opcional)
+
+    Retorna:
+    Mejor individuo encontrado y su recompensa. Las métricas quedan en self.metricas
+    """
+    def ejecutar(self, maze, start, end, genome_length, generaciones=100, umbral=None):
+        inicio = time.perf_counter()
+        poblaciones, recompensas, estados = [], [], []
+        # Poblaciones iniciales deterministas por isla: el solver usa el generador global, que se lleva al
+        # estado de la semilla derivada de la isla k y se devuelve al estado del llamador al terminar
+        solver = self.crearSolver()
+        solver.evaluaciones = 0
+        estadoLlamador = random.getstate()
+        try:
+            for k in range(self.islas):
+                random.setstate(random.Random(semillaDerivada(self.semilla, f'isla{k}')).getstate())
+                poblacion = solver.generate_population(self.tamañoIsla, genome_length)
+                recompensas.append(solver.evaluate(poblacion, [None] * len(poblacion), maze, start, end))
+                poblaciones.append(poblacion)
+                estados.append(random.getstate())
+        finally:
+            random.setstate(estadoLlamador)
+        evaluaciones = solver.evaluaciones
+        generadorMigracion = random.Random(semillaDerivada(self.semilla, 'migracion'))
+
+        # Los trabajadores reportan el instante de su primera solución con time.time
+        inicioReloj = time.time() - (time.perf_counter() - inicio)
+        tiempoSolucion, generacionSolucion = None, None
+        contexto = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+        with contexto.Pool(self.procesos, initializer=inicializarTrabajador, initargs=(self.crearSolver, maze, start, end)) as grupo:
+            generacion = 0
+            while generacion < generaciones:
+                epoca = min(self.intervaloMigracion, generaciones - generacion)
+                tareas = [(poblaciones[k], recompensas[k], estados[k], epoca, umbral) for k in range(self.islas)]
+                resultados = grupo.map(evolucionarIsla, tareas)
+                poblaciones = [r[0] for r in resultados]
+                recompensas = [r[1] for r in resultados]
+                estados = [r[2] for r in resultados]
+                evaluaciones += sum(r[5] for r in resultados)
+                soluciones = [(r[4], r[3]) for r in resultados if r[3] is not None]
+                if tiempoSolucion is None and soluciones:
+                    # Entre las islas que encontraron solución en la época gana la que la encontró primero
+                    instante, generacionIsla = min(soluciones)
+                    tiempoSolucion = instante - inicioReloj
+                    generacionSolucion = generacion + generacionIsla + 1
+                generacion += epoca
+                if generacion < generaciones:
+                    self.migrar(poblaciones, recompensas, generadorMigracion)
+
+        mejorIsla = max(range(self.islas), key=lambda k: max(recompensas[k]))
+        mejor = max(range(len(poblaciones[mejorIsla])), key=lambda j: recompensas[mejorIsla][j])
+        self.metricas = {'tiempo': time.perf_counter() - inicio, 'tiempoPrimeraSolucion': tiempoSolucion,
+                         'generacionPrimeraSolucion': generacionSolucion, 'evaluaciones': evaluaciones}
+        return poblaciones[mejorIsla][mejor], recompensas[mejorIsla][mejor]
+
+
+"""
+    Compara una sola población con el modelo de islas con el mismo número de evaluaciones por generación
+
+    Parametros:
+    modelo: ModeloIslas configurado
+    maze: Laberinto
+    start: Punto de inicio
+    end: Punto final
+    genome_length: Longitud del genoma
+    generaciones: Número de generaciones
+    umbral: Recompensa a partir de la cual un individuo se considera solución
+
+    Retorna:
+    Diccionario con las métricas de ambas ejecuciones y la aceleración (speedup)
+"""
+def compararConUnaPoblacion(modelo, maze, start, end, genome_length, generaciones, umbral):
+    estadoLlamador = random.getstate()
+    try:
+        random.setstate(random.Random(semillaDerivada(modelo.semilla, 'unaPoblacion')).getstate())
+        solver = modelo.crearSolver()
+        poblacion = solver.generate_population(modelo.islas * modelo.tamañoIsla, genome_length)
+        _, recompensaUna, metricasUna = ejecutarUnaPoblacion(solver, poblacion, maze, start, end, generaciones, umbral)
+    finally:
+        random.setstate(estadoLlamador)
+    _, recompensaIslas = modelo.ejecutar(maze, start, end, genome_length, generaciones, umbral)
+    metricasIslas = modelo.metricas
+    return {
+        'unaPoblacion': dict(metricasUna, mejor=recompensaUna),
+        'islas': dict(metricasIslas, mejor=recompensaIslas),
+        'speedup': metricasUna['tiempo'] / metricasIslas['tiempo']
+    }
@@ -0,0 +1,191 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Generador de laberintos reproducible y almacenamiento compacto. A diferencia de
+create_maze (que fija np.random.seed pero usa el módulo random), todos los números
+aleatorios salen de un np.random.Generator explícito, por lo que la misma semilla
+produce siempre el mismo laberinto.
+
+Algoritmos disponibles (ambos producen laberintos perfectos, con un único camino
+entre cada par de celdas, y el mismo formato que create_maze):
+- 'dfs': backtracking iterativo (igual que create_maze), recomendado hasta dim ~ 1000.
+- 'sidewinder': completamente vectorizado por bloques de filas, rápido para dim = 5000+.
+
+Las paredes se guardan como uint8 (1 byte por celda en lugar de 8) y se pueden
+guardar en .npy, ya sea sin comprimir (se abre al instante mapeado en memoria) o
+empaquetado en bits (1 bit por celda).
+
+"""
+
+import os
+from itertools import permutations
+
+import numpy as np
+
+# Órdenes posibles de las cuatro direcciones (derecha, abajo, izquierda, arriba)
+DIRECCIONES = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+ORDENES = list(permutations(range(4)))
+ORDENES_DIRECCIONES = [[DIRECCIONES[d] for d in orden] for orden in ORDENES]
+# Filas de celdas que se procesan a la vez en el algoritmo sidewinder
+FILAS_POR_BLOQUE = 512
+
+
+"""
+    Crea un generador aleatorio a partir de una semilla o retorna el generador recibido
+"""
+def obtenerGenerador(semilla):
+    return semilla if isinstance(semilla, np.random.Generator) else np.random.default_rng(semilla)
+
+
+"""
+    Genera el laberinto con backtracking iterativo (sin recursión)
+
+    Parametros:
+    dim: Número de celdas por lado
+    generador: np.random.Generator
+
+    Retorna:
+    Laberinto de (2 * dim + 1) x (2 * dim + 1) en uint8 (1 pared, 0 camino)
+"""
+def laberintoDFS(dim, generador):
+    visitadas = bytearray(dim * dim)
+    visitadas[0] = 1
+    # Celdas y paredes abiertas, que se escriben en el laberinto al final de forma vectorizada
+    abiertasX, abiertasY = [1], [1]
+    pila = [(0, 0)]
+    # Los órdenes aleatorios de las direcciones se generan de una vez
+    ordenes = generador.integers(0, len(ORDENES), size=2 * dim * dim, dtype=np.uint8).tolist()
+    usados = 0
+    while pila:
+        x, y = pila[-1]
+        for dx, dy in ORDENES_DIRECCIONES[ordenes[usados]]:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < dim and 0 <= ny < dim and not visitadas[nx * dim + ny]:
+                visitadas[nx * dim + ny] = 1
+                abiertasX += [2 * nx + 1, 2 * x + 1 + dx]
+                abiertasY += [2 * ny + 1, 2 * y + 1 + dy]
+                pila.append((nx, ny))
+                break
+        else:
+            pila.pop()
+        usados += 1
+    maze = np.ones((dim * 2 + 1, dim * 2 + 1), dtype=np.uint8)
+    maze[abiertasX, abiertasY] = 0
+    return maze
+
+
+"""
+    Genera el laberinto con el algoritmo sidewinder vectorizado. La primera fila es un corredor;
+    en las demás filas cada celda abre la pared derecha con probabilidad 1/2 y, de cada tramo
+    horizontal formado, una celda al azar abre la pared superior
+
+    Parametros:
+    dim: Número de celdas por lado
+    generador: np.random.Generator
+
+    Retorna:
+    Laberinto de (2 * dim + 1) x (2 * dim + 1) en uint8 (1 pared, 0 camino)
+"""
+def laberintoSidewinder(dim, generador):
+    maze = np.ones((dim * 2 + 1, dim * 2 + 1), dtype=np.uint8)
+    maze[1::2, 1::2] = 0
+    maze[1, 2:2 * dim:2] = 0
+    for inicioBloque in range(1, dim, FILAS_POR_BLOQUE):
+        filas = min(FILAS_POR_BLOQUE, dim - inicioBloque)
+        abreDerecha = generador.integers(0, 2, size=(filas, dim), dtype=np.uint8).astype(bool)
+        abreDerecha[:, -1] = False
+        # Paredes derechas abiertas de las filas del bloque
+        bloque = maze[2 * inicioBloque + 1:2 * (inicioBloque + filas):2, 2:2 * dim + 1:2]
+        bloque[abreDerecha] = 0
+
+        # Un tramo empieza en la primera columna o después de una celda que no abrió su pared derecha
+        inicioTramo = np.ones((filas, dim), dtype=bool)
+        inicioTramo[:, 1:] = ~abreDerecha[:, :-1]
+        inicios = np.flatnonzero(inicioTramo)
+        longitudes = np.diff(np.append(inicios, filas * dim))
+        elegidas = inicios + (generador.random(len(inicios)) * longitudes).astype(np.int64)
+        fila, columna = np.divmod(elegidas, dim)
+        maze[2 * (fila + inicioBloque), 2 * columna + 1] = 0
+
+    return maze
+
+
+"""
+    Genera un laberinto reproducible con el mismo formato de create_maze
+
+    Parametros:
+    dim: Número de celdas por lado
+    semilla: Semilla entera o np.random.Generator
+    algoritmo: 'dfs' o 'sidewinder'
+
+    Retorna:
+    Laberinto en uint8 con la entrada en (1, 0) y la salida en (-2, -1)
+"""
+def crearLaberinto(dim, semilla=2, algoritmo='dfs'):
+    generador = obtenerGenerador(semilla)
+    if algoritmo == 'dfs':
+        maze = laberintoDFS(dim, generador)
+    elif algoritmo == 'sidewinder':
+        maze = laberintoSidewinder(dim, generador)
+    else:
+        raise ValueError(f"Algoritmo no soportado: {algoritmo}")
+    maze[1, 0] = 0  # Entrada
+    maze[-2, -1] = 0  # Salida
+    return maze
+
+
+"""
+    Guarda un laberinto en un archivo .npy. Se escribe primero un archivo temporal que luego reemplaza al
+    definitivo, para que una escritura interrumpida nunca deje un .npy incompleto (igual que guardarNpzAtomico)
+
+    Parametros:
+    ruta: Ruta del archivo
+    maze: Laberinto
+    empaquetado: Si es True se guarda un bit por celda; si no, un byte por celda (se puede mapear en memoria)
+"""
+def guardarLaberinto(ruta, maze, empaquetado=False):
+    maze = np.asarray(maze, dtype=np.uint8)
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as archivo:
+        np.save(archivo, np.packbits(maze, axis=1) if empaquetado else maze)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+"""
+    Abre un laberinto guardado con guardarLaberinto. Los laberintos son cuadrados, por lo que un
+    arreglo que no es cuadrado corresponde a un laberinto empaquetado en bits
+
+    Parametros:
+    ruta: Ruta del archivo
+    mmap: Si es True el laberinto sin empaquetar se mapea en memoria (solo lectura) en lugar de leerse
+
+    Retorna:
+    Laberinto en uint8
+"""
+def cargarLaberinto(ruta, mmap=True):
+    maze = np.load(ruta, mmap_mode='r' if mmap else None)
+    if maze.shape[0] != maze.shape[1]:
+        maze = np.unpackbits(maze, axis=1, count=maze.shape[0])
+    return maze
+
+
+"""
+    Abre el laberinto si ya existe en disco; si no, lo genera y lo guarda
+
+    Parametros:
+    ruta: Ruta del archivo (debe terminar en .npy); su carpeta se crea si no existe
+    dim, semilla, algoritmo: Parámetros de crearLaberinto
+    empaquetado: Formato del archivo
+
+    Retorna:
+    Laberinto en uint8
+"""
+def generarOCargar(ruta, dim, semilla=2, algoritmo='sidewinder', empaquetado=False):
+    if not os.path.exists(ruta):
+        os.makedirs(os.path.dirname(ruta) or '.', exist_ok=True)
+        guardarLaberinto(ruta, crearLaberinto(dim, semilla, algoritmo), empaquetado)
+    return cargarLaberinto(ruta)
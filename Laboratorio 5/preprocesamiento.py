@@ -0,0 +1,177 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Preprocesamiento del laberinto generado por create_maze. Se calcula una sola vez:
+- El campo de distancias BFS (camino más corto real) desde cada celda hasta la salida.
+- La tabla de saltos: cuántas celdas libres se pueden avanzar desde cada celda en
+  cada dirección antes de chocar con una pared.
+- Opcionalmente (grafo=True), el grafo de cruces y corredores: los nodos son las celdas
+  con un número de vecinos libres distinto de dos (cruces, callejones sin salida) más el
+  inicio y el final, y las aristas son los corredores que los unen con su longitud. La
+  evaluación no lo usa, por lo que no se construye por defecto.
+
+Todas las matrices usan las coordenadas del laberinto con un borde de paredes de una
+celda alrededor (coordenada + 1), igual que en evaluacion.py.
+
+Las matrices usan el entero más pequeño que alcanza para sus valores. Las distancias
+llegan hasta el número de celdas, por lo que usan int32 (4 bytes por celda; int16 si
+el laberinto tiene menos de 32768 celdas). Los saltos no superan el lado del
+laberinto, por lo que usan int16 (4 direcciones x 2 bytes = 8 bytes por celda). Con
+dim = 5000 (10003 x 10003 celdas con el borde) son unos 400 MB y 800 MB, frente a
+800 MB y 3.2 GB con int64. La evaluación convierte a int64 al operar con los genomas,
+así que las sumas no se desbordan.
+
+"""
+
+import numpy as np
+
+from evaluacion import DX, DY
+
+
+"""
+    Retorna el tipo entero con signo más pequeño (int16, int32 o int64) que representa valores hasta maximo
+"""
+def tipoEntero(maximo):
+    return next(tipo for tipo in (np.int16, np.int32, np.int64) if maximo <= np.iinfo(tipo).max)
+
+
+"""
+    Calcula la distancia BFS de cada celda libre hasta el punto final. La búsqueda avanza por niveles:
+    en cada nivel se expande toda la frontera a la vez con numpy (o celda a celda si la frontera es pequeña)
+
+    Parametros:
+    libres: Máscara de celdas libres con borde
+    fin: Punto final (con borde)
+
+    Retorna:
+    Matriz de distancias (del tipo tipoEntero(libres.size)), con -1 en las celdas inalcanzables o paredes
+"""
+def distanciasBFS(libres, fin):
+    ancho = libres.shape[1]
+    planos = libres.ravel()
+    # El tipo también debe representar libres.size, el valor que AnalisisLaberinto da a las celdas inalcanzables
+    distancias = np.full(libres.size, -1, dtype=tipoEntero(libres.size))
+    vecinos = DX * ancho + DY
+    listaVecinos = vecinos.tolist()
+    frontera = [fin[0] * ancho + fin[1]]
+    distancias[frontera] = 0
+    nivel = 0
+    # El borde de paredes garantiza que los vecinos de una celda libre están dentro de la matriz
+    while len(frontera):
+        nivel += 1
+        if len(frontera) <= 16:
+            # En los corredores la frontera tiene una o dos celdas y numpy no compensa su costo por llamada
+            siguientes = []
+            for celda in frontera:
+                for desplazamiento in listaVecinos:
+                    vecino = celda + desplazamiento
+                    if planos[vecino] and distancias[vecino] < 0:
+                        distancias[vecino] = nivel
+                        siguientes.append(vecino)
+            frontera = siguientes
+        else:
+            candidatos = (np.asarray(frontera)[:, None] + vecinos).ravel()
+            candidatos = np.unique(candidatos[planos[candidatos] & (distancias[candidatos] < 0)])
+            distancias[candidatos] = nivel
+            frontera = candidatos
+    return distancias.reshape(libres.shape)
+
+
+"""
+    Calcula la tabla de saltos hasta la pared para cada celda y dirección
+
+    Parametros:
+    libres: Máscara de celdas libres con borde
+
+    Retorna:
+    Arreglo de 4 x alto x ancho con la cantidad de celdas libres consecutivas en cada dirección
+    (int16 mientras el lado del laberinto no supere 32767 celdas)
+"""
+def tablaSaltos(libres):
+    alto, ancho = libres.shape
+    saltos = np.zeros((4,) + libres.shape, dtype=tipoEntero(max(libres.shape)))
+    # Derecha e izquierda: se recorre por columnas, vectorizado sobre las filas
+    for y in range(ancho - 2, -1, -1):
+        saltos[0, :, y] = np.where(libres[:, y + 1], saltos[0, :, y + 1] + 1, 0)
+    for y in range(1, ancho):
+        saltos[1, :, y] = np.where(libres[:, y - 1], saltos[1, :, y - 1] + 1, 0)
+    # Arriba y abajo: se recorre por filas, vectorizado sobre las columnas
+    for x in range(1, alto):
+        saltos[2, x] = np.where(libres[x - 1], saltos[2, x - 1] + 1, 0)
+    for x in range(alto - 2, -1, -1):
+        saltos[3, x] = np.where(libres[x + 1], saltos[3, x + 1] + 1, 0)
+    return saltos
+
+
+"""
+    Comprime el laberinto en un grafo de cruces y corredores
+
+    Parametros:
+    libres: Máscara de celdas libres con borde
+    extremos: Celdas que siempre son nodos (inicio y final, con borde)
+
+    Retorna:
+    Diccionario {nodo: [(vecino, longitud del corredor, dirección inicial)]}
+"""
+def grafoCorredores(libres, extremos=()):
+    grados = sum(np.roll(libres, (-dx, -dy), axis=(0, 1)) for dx, dy in zip(DX, DY)) * libres
+    esNodo = libres & (grados != 2)
+    for x, y in extremos:
+        esNodo[x, y] = True
+
+    grafo = {}
+    for x, y in zip(*np.nonzero(esNodo)):
+        nodo = (int(x), int(y))
+        grafo[nodo] = []
+        for direccion in range(4):
+            dx, dy = int(DX[direccion]), int(DY[direccion])
+            if not libres[x + dx, y + dy]:
+                continue
+            # Se sigue el corredor hasta llegar a otro nodo
+            anterior, actual, longitud = nodo, (x + dx, y + dy), 1
+            while not esNodo[actual]:
+                cx, cy = actual
+                siguiente = next((cx + int(DX[d]), cy + int(DY[d])) for d in range(4)
+                                 if libres[cx + DX[d], cy + DY[d]] and (cx + DX[d], cy + DY[d]) != anterior)
+                anterior, actual, longitud = actual, siguiente, longitud + 1
+            grafo[nodo].append(((int(actual[0]), int(actual[1])), longitud, direccion))
+    return grafo
+
+
+class AnalisisLaberinto:
+    """
+    Resultado del preprocesamiento de un laberinto para un punto de inicio y un punto final
+    """
+
+    """
+    Preprocesa el laberinto
+
+    Parametros:
+    maze: Laberinto (0 libre, 1 pared)
+    start: Punto de inicio
+    end: Punto final
+    grafo: Si es True también se construye el grafo de cruces y corredores (no lo usa la evaluación)
+    """
+    def __init__(self, maze, start, end, grafo=False):
+        self.libres = np.pad(np.asarray(maze) == 0, 1, constant_values=False)
+        self.inicio = (start[0] + 1, start[1] + 1)
+        self.fin = (end[0] + 1, end[1] + 1)
+        self.distancias = distanciasBFS(self.libres, self.fin)
+        # Las celdas inalcanzables se consideran a la mayor distancia posible
+        self.distancias[self.distancias < 0] = self.libres.size
+        self.saltos = tablaSaltos(self.libres)
+        self.grafo = grafoCorredores(self.libres, (self.inicio, self.fin)) if grafo else None
+
+    """
+    Retorna la distancia real (BFS) desde una celda del laberinto hasta la salida
+    """
+    def distancia(self, x, y):
+        return int(self.distancias[x + 1, y + 1])
+
+    """
+    Retorna cuántas celdas se pueden avanzar desde una celda del laberinto en una dirección
+    """
+    def salto(self, x, y, direccion):
+        return int(self.saltos[direccion, x + 1, y + 1])
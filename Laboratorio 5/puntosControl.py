@@ -0,0 +1,186 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Puntos de control para reanudar ejecuciones largas de los algoritmos genéticos.
+Cada N generaciones se guarda en un único archivo .npz el estado completo de la
+ejecución: población, recompensas en caché, generación, mejor individuo y el
+estado del módulo random. Al reanudar desde el archivo la ejecución continúa
+exactamente igual (bit a bit) que si no se hubiera interrumpido.
+
+Para que el costo de guardar no pese en ejecuciones con generaciones muy rápidas,
+se puede fijar un presupuesto: solo se guarda si el tiempo acumulado de guardado,
+sumando el costo estimado del nuevo guardado, no supera esa fracción del tiempo
+transcurrido de la ejecución. El presupuesto también aplica al guardado final: si
+se omite, reanudar desde el punto de control anterior da el mismo resultado.
+También se puede fijar un intervalo mínimo en segundos entre guardados, para que la
+frecuencia de guardado no dependa de cuánto dura cada generación.
+
+La escritura es atómica: el archivo se escribe completo en un temporal del mismo
+directorio y luego se reemplaza con os.replace, por lo que una interrupción durante
+el guardado deja intacto el punto de control anterior.
+
+"""
+
+import os
+import random
+import time
+
+import numpy as np
+
+
+"""
+    Convierte el estado del módulo random en arreglos que se pueden guardar en un .npz
+
+    Retorna:
+    Diccionario con la versión, los 625 enteros del Mersenne Twister y el valor gaussiano pendiente (NaN si no hay)
+"""
+def estadoRandom():
+    version, interno, gaussiano = random.getstate()
+    return {
+        'randomVersion': np.array(version),
+        'randomInterno': np.array(interno, dtype=np.uint32),
+        'randomGaussiano': np.array(np.nan if gaussiano is None else gaussiano)
+    }
+
+
+"""
+    Restaura el estado del módulo random guardado con estadoRandom
+"""
+def restaurarRandom(estado):
+    gaussiano = float(estado['randomGaussiano'])
+    random.setstate((int(estado['randomVersion']), tuple(estado['randomInterno'].tolist()),
+                     None if np.isnan(gaussiano) else gaussiano))
+
+
+"""
+    Convierte una población de genomas de igual longitud en un arreglo compacto
+
+    Parametros:
+    poblacion: Lista de individuos (listas de direcciones o de tuplas (dirección, pasos))
+
+    Retorna:
+    Arreglo de P x L (genoma de un paso por gen) o de P x L x 2 (genoma de tuplas)
+"""
+def poblacionAArreglo(poblacion):
+    genomas = np.asarray(poblacion, dtype=np.int64)
+    # Las direcciones y los pasos de un solo gen caben en tipos más pequeños
+    return genomas.astype(np.int8) if genomas.ndim == 2 else genomas.astype(np.int32)
+
+
+"""
+    Reconstruye la población a partir del arreglo de poblacionAArreglo, con los mismos tipos de Python
+"""
+def arregloAPoblacion(genomas):
+    if genomas.ndim == 2:
+        return genomas.tolist()
+    return [[tuple(gen) for gen in individuo] for individuo in genomas.tolist()]
+
+
+"""
+    Escribe un .npz de forma atómica (temporal en el mismo directorio + os.replace)
+
+    Parametros:
+    ruta: Ruta del archivo .npz
+    comprimir: Si es True se usa np.savez_compressed (más pequeño pero más lento)
+    arreglos: Arreglos a guardar
+"""
+def guardarNpzAtomico(ruta, comprimir=False, **arreglos):
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as archivo:
+        (np.savez_compressed if comprimir else np.savez)(archivo, **arreglos)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+class PuntosControl:
+    """
+    Guarda y carga el punto de control de una ejecución cada N generaciones, midiendo el tiempo de guardado.
+    Se debe crear justo antes de ejecutar, ya que el presupuesto se mide desde su creación
+    """
+
+    # Duración del último guardado de cualquier instancia, para estimar el primero de una ejecución nueva
+    ultimoCosto = 0.0
+
+    """
+    Inicializa los puntos de control
+
+    Parametros:
+    ruta: Archivo .npz del punto de control
+    cadaN: Se guarda una de cada N generaciones (y la última)
+    comprimir: Si es True el archivo se comprime
+    presupuesto: Fracción máxima del tiempo de ejecución dedicada a guardar (opcional, por ejemplo 0.02)
+    cadaSegundos: Segundos mínimos desde el último guardado (o desde la creación) para volver a guardar (opcional)
+    """
+    def __init__(self, ruta, cadaN=10, comprimir=False, presupuesto=None, cadaSegundos=None):
+        self.ruta = ruta
+        self.cadaN = cadaN
+        self.comprimir = comprimir
+        self.presupuesto = presupuesto
+        self.cadaSegundos = cadaSegundos
+        self.guardados = 0
+        self.tiempoGuardado = 0.0
+        self.inicio = time.perf_counter()
+        self.instanteGuardado = self.inicio
+
+    """
+    Retorna True si existe un punto de control en disco
+    """
+    def existe(self):
+        return os.path.exists(self.ruta)
+
+    """
+    Retorna True si la generación (ya completada) debe guardarse: una de cada N generaciones y la última
+    (la del máximo de generaciones o, con final=True, aquella en la que la ejecución se detiene antes),
+    siempre que ya haya pasado el intervalo en segundos y el guardado quepa en el presupuesto
+    """
+    def debeGuardar(self, generacion, generaciones, final=False):
+        if not (final or generacion == generaciones or generacion % self.cadaN == 0):
+            return False
+        if self.cadaSegundos is not None and time.perf_counter() - self.instanteGuardado < self.cadaSegundos:
+            return False
+        return self.presupuesto is None or self.tiempoGuardado + self.costoEstimado() <= self.presupuesto * (time.perf_counter() - self.inicio)
+
+    """
+    Retorna el costo estimado de un guardado: el promedio de los guardados de esta ejecución o, si aún no
+    hay ninguno, el del último guardado de cualquier ejecución (0 si nunca se ha guardado)
+    """
+    def costoEstimado(self):
+        return self.tiempoGuardado / self.guardados if self.guardados else PuntosControl.ultimoCosto
+
+    """
+    Guarda el estado de la ejecución junto con el estado actual del módulo random
+
+    Parametros:
+    generacion: Generaciones completadas
+    datos: Arreglos o valores del estado (población, recompensas, mejor individuo, ...)
+    """
+    def guardar(self, generacion, **datos):
+        inicio = time.perf_counter()
+        guardarNpzAtomico(self.ruta, self.comprimir, generacion=np.array(generacion), **datos, **estadoRandom())
+        self.instanteGuardado = time.perf_counter()
+        costo = self.instanteGuardado - inicio
+        self.guardados += 1
+        self.tiempoGuardado += costo
+        PuntosControl.ultimoCosto = costo
+
+    """
+    Carga el último punto de control y restaura el estado del módulo random
+
+    Retorna:
+    Diccionario con los arreglos guardados
+    """
+    def cargar(self):
+        with np.load(self.ruta) as archivo:
+            estado = {nombre: archivo[nombre] for nombre in archivo.files}
+        restaurarRandom(estado)
+        return estado
+
+    """
+    Elimina el punto de control (por ejemplo cuando la ejecución terminó)
+    """
+    def eliminar(self):
+        if self.existe():
+            os.remove(self.ruta)
@@ -0,0 +1,215 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Renderizado de los mapas de calor de las soluciones sin bloquear el algoritmo
+genético. El algoritmo solo encola una copia del genoma; el recorrido del camino, el
+conteo de visitas (vectorizado con np.add.at) y el dibujo se hacen en un hilo en
+segundo plano, solo cada N generaciones o cuando mejora la recompensa, y los cuadros
+se guardan en disco (y opcionalmente como una animación .gif al cerrar).
+
+"""
+
+import os
+import queue
+import threading
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Direcciones de los genes: derecha, izquierda, arriba, abajo
+DIRECCIONES = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+
+"""
+    Calcula las celdas recorridas por un individuo con genoma de un paso por gen (solucionP2.ipynb)
+
+    Parametros:
+    maze: Laberinto
+    start: Punto de inicio
+    solution: Individuo
+
+    Retorna:
+    Arreglos con las filas y columnas de las celdas recorridas, incluyendo el inicio
+"""
+def trayectoriaPasoSimple(maze, start, solution):
+    alto, ancho = len(maze), len(maze[0])
+    x, y = start
+    filas, columnas = [x], [y]
+    for move in solution:
+        dx, dy = DIRECCIONES[move]
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < alto and 0 <= ny < ancho and maze[nx][ny] == 0:
+            x, y = nx, ny
+            filas.append(x)
+            columnas.append(y)
+    return np.array(filas), np.array(columnas)
+
+
+"""
+    Calcula las celdas recorridas por un individuo con genoma de tuplas (dirección, pasos) (solucionP3.ipynb)
+
+    Parametros:
+    maze: Laberinto
+    start: Punto de inicio
+    solution: Individuo
+
+    Retorna:
+    Arreglos con las filas y columnas de las celdas recorridas, incluyendo el inicio y el tramo inicial
+"""
+def trayectoriaPorTramos(maze, start, solution):
+    alto, ancho = len(maze), len(maze[0])
+    x, y = start
+    filas, columnas = [x], [y]
+    while 0 <= y + 1 < ancho and maze[x][y + 1] == 0:
+        y += 1
+        filas.append(x)
+        columnas.append(y)
+    for direccion, steps in solution:
+        dx, dy = DIRECCIONES[direccion]
+        while 0 <= x + dx < alto and 0 <= y + dy < ancho and maze[x + dx][y + dy] == 0 and steps > 0:
+            x, y = x + dx, y + dy
+            filas.append(x)
+            columnas.append(y)
+            steps -= 1
+    return np.array(filas), np.array(columnas)
+
+
+"""
+    Acumula el número de visitas de cada celda del camino con np.add.at (las celdas repetidas suman)
+
+    Parametros:
+    forma: Forma del laberinto
+    filas, columnas: Celdas recorridas
+
+    Retorna:
+    Matriz con el número de visitas por celda
+"""
+def conteoVisitas(forma, filas, columnas):
+    conteo = np.zeros(forma, dtype=int)
+    np.add.at(conteo, (filas, columnas), 1)
+    return conteo
+
+
+"""
+    Dibuja el mapa de calor de visitas en una figura independiente de pyplot (segura fuera del hilo principal)
+
+    Parametros:
+    conteo: Matriz de visitas
+    generacion: Número de generación
+    ruta: Archivo donde se guarda la imagen
+"""
+def guardarMapaDeCalor(conteo, generacion, ruta):
+    figura = Figure(figsize=(8, 8))
+    FigureCanvasAgg(figura)
+    eje = figura.add_subplot()
+    eje.set_title(f"Frecuencia de Movimientos en el Laberinto (Generación {generacion})")
+    imagen = eje.imshow(conteo, cmap='hot', interpolation='nearest')
+    figura.colorbar(imagen, ax=eje, label="Número de Visitas")
+    eje.set_xlabel("Columnas")
+    eje.set_ylabel("Filas")
+    figura.savefig(ruta)
+
+
+class DibujanteAsincrono:
+    """
+    Reemplazo de SolutionDrawer que no bloquea la evolución: el hilo del algoritmo solo encola el genoma,
+    y el camino, el conteo de visitas, el dibujo y el guardado en disco se hacen en un hilo en segundo plano.
+    Un error al dibujar un cuadro se cuenta en errores (y se guarda en ultimoError) sin detener el hilo
+    """
+
+    """
+    Inicializa el dibujante y arranca el hilo de renderizado
+
+    Parametros:
+    trayectoria: trayectoriaPasoSimple o trayectoriaPorTramos, según el genoma
+    directorio: Carpeta donde se guardan los cuadros
+    cadaN: Se dibuja una de cada N generaciones
+    alMejorar: Si es True también se dibuja cada vez que mejora la recompensa
+    animacion: Ruta de un .gif que se arma con los cuadros al cerrar (opcional)
+    maxPendientes: Cuadros en cola; si la cola está llena el cuadro se descarta en lugar de esperar
+    """
+    def __init__(self, trayectoria, directorio, cadaN=10, alMejorar=True, animacion=None, maxPendientes=8):
+        self.trayectoria = trayectoria
+        self.directorio = directorio
+        self.cadaN = cadaN
+        self.alMejorar = alMejorar
+        self.animacion = animacion
+        self.mejorFitness = None
+        self.cuadros = []
+        self.descartados = 0
+        self.errores = 0
+        self.ultimoError = None
+        os.makedirs(directorio, exist_ok=True)
+        self.cola = queue.Queue(maxsize=maxPendientes)
+        self.hilo = threading.Thread(target=self.renderizar, daemon=True)
+        self.hilo.start()
+
+    """
+    Bucle del hilo en segundo plano: dibuja los cuadros de la cola hasta recibir None. Las excepciones de
+    un cuadro se cuentan y el hilo sigue con el siguiente, para que close nunca espere a un hilo muerto
+    """
+    def renderizar(self):
+        while True:
+            cuadro = self.cola.get()
+            if cuadro is None:
+                break
+            maze, start, solution, generacion, ruta = cuadro
+            try:
+                conteo = conteoVisitas(np.shape(maze), *self.trayectoria(maze, start, solution))
+                guardarMapaDeCalor(conteo, generacion, ruta)
+                self.cuadros.append(ruta)
+            except Exception as error:
+                self.errores += 1
+                self.ultimoError = error
+
+    """
+    Mismo uso que SolutionDrawer.draw. Solo encola el cuadro si toca por la generación o por mejora. Se
+    encola una copia superficial del genoma porque la mutación modifica los individuos en su lugar
+    """
+    def draw(self, maze, start, solution, generacion, fitness=None):
+        mejora = fitness is not None and (self.mejorFitness is None or fitness > self.mejorFitness)
+        if mejora:
+            self.mejorFitness = fitness
+        if generacion % self.cadaN != 0 and not (self.alMejorar and mejora):
+            return
+        ruta = os.path.join(self.directorio, f"generacion_{generacion:05d}.png")
+        try:
+            self.cola.put_nowait((maze, start, list(solution), generacion, ruta))
+        except queue.Full:
+            self.descartados += 1
+
+    """
+    Espera a que se dibujen los cuadros pendientes y, si se pidió, arma la animación
+
+    Parametros:
+    espera: Segundos máximos para encolar el fin y para esperar al hilo (los cuadros que no alcancen se pierden)
+    """
+    def close(self, espera=60):
+        if self.hilo.is_alive():
+            try:
+                self.cola.put(None, timeout=espera)
+            except queue.Full:
+                pass
+            self.hilo.join(timeout=espera)
+        if self.animacion and self.cuadros:
+            from PIL import Image
+            imagenes = [Image.open(ruta) for ruta in self.cuadros]
+            imagenes[0].save(self.animacion, save_all=True, append_images=imagenes[1:], duration=300, loop=0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.close()
+
+
+class DibujanteNulo:
+    """
+    Dibujante que no dibuja, para medir solo el tiempo de la evolución
+    """
+
+    def draw(self, maze, start, solution, generacion, fitness=None):
+        pass
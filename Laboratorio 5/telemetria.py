@@ -0,0 +1,297 @@
+"""
+** Integrantes - Grupo 15 **
+
+Daniel Felipe Diaz Moreno y Sara Sofía Cárdenas Rodríguez
+
+Módulo de telemetría generacional para los algoritmos genéticos del laboratorio.
+En lugar de guardar una copia ordenada de toda la población en cada generación,
+se registra un resumen barato (mejor, promedio, peor y diversidad) y se envía a
+uno o varios sumideros intercambiables: una función, un buffer circular con las
+últimas K generaciones, un muestreo cada N generaciones o un arreglo en disco.
+Los sumideros de lista y de disco conservan todas las generaciones (completos); el
+buffer circular y el muestreo conservan solo un subconjunto.
+
+"""
+
+import os
+from collections import deque
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+
+"""
+    Calcula el resumen de una generación a partir de las aptitudes y genotipos
+
+    Parametros:
+    generacion: Número de generación
+    aptitudes: Lista de aptitudes de la población
+    genotipos: Lista de genotipos numéricos de la población
+    fondo: Color del fondo en la generación (opcional)
+
+    Retorna:
+    Diccionario con el mejor, el peor, el promedio y la diversidad (desviación estándar de los genotipos)
+"""
+def resumirGeneracion(generacion, aptitudes, genotipos, fondo=None):
+    n = len(genotipos)
+    media = sum(genotipos) / n
+    return {
+        'generacion': generacion,
+        'mejor': max(aptitudes),
+        'peor': min(aptitudes),
+        'promedio': sum(aptitudes) / len(aptitudes),
+        'diversidad': (sum((g - media) ** 2 for g in genotipos) / n) ** 0.5,
+        'fondo': fondo
+    }
+
+
+class SumideroLista:
+    """
+    Sumidero sin límite que conserva todas las generaciones (comportamiento original)
+    """
+
+    completo = True
+
+    """
+    Inicializa el sumidero, indicando si se guardan también las filas de genotipos
+    """
+    def __init__(self, guardarFilas=True):
+        self.requiereFila = guardarFilas
+        self.resumenes = []
+        self.filasGuardadas = []
+
+    """
+    Indica si el sumidero acepta la generación dada
+    """
+    def acepta(self, generacion):
+        return True
+
+    """
+    Recibe el resumen y (si aplica) la fila ordenada de genotipos de una generación
+    """
+    def recibir(self, resumen, fila):
+        self.resumenes.append(resumen)
+        if self.requiereFila:
+            self.filasGuardadas.append(fila)
+
+    """
+    Retorna las filas guardadas para los mapas de calor
+    """
+    def filas(self):
+        return self.filasGuardadas
+
+
+class SumideroAnillo(SumideroLista):
+    """
+    Buffer circular que conserva solo las últimas K generaciones, con memoria constante
+    """
+
+    completo = False
+
+    """
+    Inicializa el buffer con capacidad para K generaciones
+    """
+    def __init__(self, capacidad, guardarFilas=True):
+        super().__init__(guardarFilas)
+        self.capacidad = capacidad
+        self.resumenes = deque(maxlen=capacidad)
+        self.filasGuardadas = deque(maxlen=capacidad)
+
+    """
+    Retorna las filas guardadas como lista, de la más antigua a la más reciente
+    """
+    def filas(self):
+        return list(self.filasGuardadas)
+
+
+class SumideroMuestreado:
+    """
+    Envía a otro sumidero solo una de cada N generaciones
+    """
+
+    completo = False
+
+    """
+    Inicializa el muestreo sobre un sumidero interno
+    """
+    def __init__(self, sumidero, cadaN):
+        self.sumidero = sumidero
+        self.cadaN = cadaN
+        self.requiereFila = sumidero.requiereFila
+
+    def acepta(self, generacion):
+        return generacion % self.cadaN == 0 and self.sumidero.acepta(generacion)
+
+    def recibir(self, resumen, fila):
+        self.sumidero.recibir(resumen, fila)
+
+    @property
+    def resumenes(self):
+        return self.sumidero.resumenes
+
+    def filas(self):
+        return self.sumidero.filas()
+
+
+class SumideroFuncion:
+    """
+    Llama una función (callback) con el resumen de cada generación sin guardar nada
+    """
+
+    """
+    Inicializa el sumidero con la función a invocar: funcion(resumen, fila)
+    """
+    def __init__(self, funcion, requiereFila=False):
+        self.funcion = funcion
+        self.requiereFila = requiereFila
+
+    def acepta(self, generacion):
+        return True
+
+    def recibir(self, resumen, fila):
+        self.funcion(resumen, fila)
+
+    def filas(self):
+        return []
+
+
+class SumideroDisco:
+    """
+    Escribe los resúmenes y las filas en arreglos .npy mapeados en memoria.
+    La memoria en RAM es constante sin importar el número de generaciones: cuando
+    los arreglos se llenan se duplica su capacidad en disco.
+    """
+
+    completo = True
+
+    # Orden de las columnas numéricas del arreglo de resúmenes
+    COLUMNAS = ('generacion', 'mejor', 'peor', 'promedio', 'diversidad', 'fondo')
+
+    """
+    Crea los archivos <ruta>_resumen.npy y <ruta>_filas.npy
+
+    Parametros:
+    ruta: Prefijo de los archivos
+    maxGeneraciones: Capacidad inicial en generaciones (se duplica al llenarse)
+    columnas: Largo de cada fila de genotipos (0 para no guardar filas)
+    """
+    def __init__(self, ruta, maxGeneraciones, columnas=0):
+        self.ruta = ruta
+        self.requiereFila = columnas > 0
+        self.cantidad = 0
+        self.resumen = open_memmap(f'{ruta}_resumen.npy', mode='w+', dtype=np.float64,
+                                   shape=(maxGeneraciones, len(self.COLUMNAS)))
+        self.filasDisco = None
+        if self.requiereFila:
+            self.filasDisco = open_memmap(f'{ruta}_filas.npy', mode='w+', dtype=np.int16,
+                                          shape=(maxGeneraciones, columnas))
+
+    def acepta(self, generacion):
+        return True
+
+    """
+    Copia el arreglo mapeado del atributo indicado a un archivo nuevo con el doble de
+    filas y lo reemplaza. El mapeo anterior se suelta antes de os.replace porque en
+    Windows un archivo mapeado no se puede reemplazar; las vistas que haya retornado
+    filas() siguen apuntando al mapeo anterior y lo mantienen abierto.
+
+    Parametros:
+    atributo: Nombre del atributo que guarda el arreglo ('resumen' o 'filasDisco')
+    archivo: Ruta del archivo .npy del arreglo
+    """
+    def duplicar(self, atributo, archivo):
+        arreglo = getattr(self, atributo)
+        temporal = f'{archivo}.tmp.npy'
+        nuevo = open_memmap(temporal, mode='w+', dtype=arreglo.dtype, shape=(2 * len(arreglo),) + arreglo.shape[1:])
+        nuevo[:self.cantidad] = arreglo[:self.cantidad]
+        nuevo.flush()
+        del nuevo
+        arreglo.flush()
+        setattr(self, atributo, None)
+        del arreglo
+        os.replace(temporal, archivo)
+        setattr(self, atributo, open_memmap(archivo, mode='r+'))
+
+    def recibir(self, resumen, fila):
+        if self.cantidad == len(self.resumen):
+            self.duplicar('resumen', f'{self.ruta}_resumen.npy')
+            if self.requiereFila:
+                self.duplicar('filasDisco', f'{self.ruta}_filas.npy')
+        self.resumen[self.cantidad] = [np.nan if resumen[c] is None else resumen[c] for c in self.COLUMNAS]
+        if self.requiereFila:
+            self.filasDisco[self.cantidad] = fila
+        self.cantidad += 1
+
+    """
+    Retorna los resúmenes escritos como lista de diccionarios
+    """
+    @property
+    def resumenes(self):
+        return [dict(zip(self.COLUMNAS, fila)) for fila in self.resumen[:self.cantidad].tolist()]
+
+    def filas(self):
+        return self.filasDisco[:self.cantidad] if self.requiereFila else []
+
+    """
+    Fuerza la escritura de los arreglos a disco
+    """
+    def cerrar(self):
+        self.resumen.flush()
+        if self.requiereFila:
+            self.filasDisco.flush()
+
+
+class Telemetria:
+    """
+    Reparte el resumen de cada generación entre varios sumideros. La fila ordenada de
+    genotipos solo se construye (y se ordena) si algún sumidero la necesita en esa generación.
+    """
+
+    """
+    Inicializa la telemetría con uno o varios sumideros. Sin sumideros se usa una lista sin límite.
+    """
+    def __init__(self, *sumideros):
+        self.sumideros = list(sumideros) or [SumideroLista()]
+
+    """
+    Registra una generación
+
+    Parametros:
+    generacion: Número de generación
+    aptitudes: Lista de aptitudes de la población
+    genotipos: Lista de genotipos de la población
+    construirFila: Función sin argumentos que retorna la fila para los mapas de calor
+    fondo: Color del fondo en la generación (opcional)
+    """
+    def registrar(self, generacion, aptitudes, genotipos, construirFila, fondo=None):
+        activos = [s for s in self.sumideros if s.acepta(generacion)]
+        if not activos:
+            return
+        resumen = resumirGeneracion(generacion, aptitudes, genotipos, fondo)
+        fila = construirFila() if any(s.requiereFila for s in activos) else None
+        for sumidero in activos:
+            sumidero.recibir(resumen, fila)
+
+    """
+    Retorna los sumideros que guardan el dato dado, primero los completos (lista o disco) y luego los parciales
+    """
+    def guardan(self, condicion):
+        candidatos = [s for s in self.sumideros if condicion(s)]
+        return [s for s in candidatos if s.completo] + [s for s in candidatos if not s.completo]
+
+    """
+    Retorna las filas de un sumidero que las guarda, preferiblemente uno completo
+    """
+    def filas(self):
+        for sumidero in self.guardan(lambda s: s.requiereFila and not isinstance(s, SumideroFuncion)):
+            return sumidero.filas()
+        return []
+
+    """
+    Retorna los resúmenes de todas las generaciones si algún sumidero es completo (lista o disco). Si solo hay
+    sumideros parciales se retornan los del primero (las últimas K generaciones o una de cada N)
+    """
+    def resumenes(self):
+        for sumidero in self.guardan(lambda s: hasattr(s, 'resumenes')):
+            return list(sumidero.resumenes)
+        return []